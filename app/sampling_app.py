@@ -1,17 +1,9 @@
 import os
-import random
+import importlib
 import logging
+import numpy as np
 import pandas as pd
 from PySide6 import QtCore, QtWidgets
-from ml_sampling.isolation_forest import isolation_forest_sampling
-from ml_sampling.lof import lof_sampling
-from ml_sampling.kmeans import kmeans_sampling
-from ml_sampling.autoencoder import autoencoder_sampling
-from ml_sampling.hdbscan import hdbscan_sampling
-from statistical_sampling.random import random_sampling
-from statistical_sampling.systematic import systematic_sampling
-from statistical_sampling.stratified import stratified_sampling
-from statistical_sampling.monetary_unit import monetary_unit_sampling
 from .workers import (
     Worker, FileLoaderWorker, PreprocessingWorker,
     VisualizationWorker, PdfGenerationWorker
@@ -39,167 +31,197 @@ class SamplingApp(QtWidgets.QMainWindow):
     sampling, visualization, and PDF report generation.
     """
 
+    # Translation dictionaries for UI text
+    TRANSLATIONS = {
+        'ua': {
+            'window_title': "Створення аудиторських вибірок",
+            'select_sampling_method': "Оберіть тип вибірки:",
+            'file_with_population_data': "Файл з генеральною сукупністю:",
+            'browse': "Огляд",
+            'sample_size': "Розмір вибірки:",
+            'strata_column': "Стовпець для стратифікації:",
+            'value_column': "Стовпець зі значеннями грошових одиниць:",
+            'use_threshold_value': "Використовувати порогове значення?",
+            'threshold_value': "Порогове значення:",
+            'use_stratification': "Використовувати стратифікацію?",
+            'continue_tuning': "Продовжити налаштування попереднього запуску?",
+            'strata_column_for_mus': "Стовпець для стратифікації:",
+            'define_column_types': "Вказати типи колонок",
+            'data_preprocessing_completed': "Передобробка даних виконана.",
+            'create_sample': "Створити вибірку",
+            'loading_file': "Завантаження файлу...",
+            'error': "Помилка",
+            'first_load_data': "Спочатку завантажте дані.",
+            'in_dataframe_no_columns_of_type': "У датафреймі немає {column_type} стовпців.",
+            'no_columns_selected_of_type': "Не вибрано жодного {column_type} стовпця.",
+            'data_preprocessing': "Передобробка даних...",
+            'creating_sample': "Створення вибірки...",
+            'file_size': "Розмір файлу",
+            'sample_saved_in_file': "Вибірку збережено у файлі",
+            'select_columns_of_type': "Виберіть {column_type} стовпці:",
+            'warning': "Попередження",
+            'data_preprocessing_not_done': "Передобробка даних не виконана. Натисніть 'Вказати типи колонок' та збережіть вибір.",
+            'no_columns_of_type_selected': "Не вибрано жодного {column_type} стовпця.",
+            'error_reading_file': "Помилка при читанні файлу",
+            'error_processing_data': "Помилка при обробці даних",
+            'error_creating_sample': "Не вдалося сформувати вибірку або вибірка порожня.",
+            'hdbscan_limit_error': "HDBSCAN не підтримує вибірки більше 300,000 рядків.",
+            'lof_limit_error': "Local Outlier Factor не підтримує вибірки більше 1,000,000 рядків.",
+            'error_title': "Помилка",
+            'file_loading_error': "Помилка при читанні файлу",
+            'visualization_error': "Помилка при створенні візуалізації",
+        },
+        'en': {
+            'window_title': "Audit Sampling Creation",
+            'select_sampling_method': "Select sampling method:",
+            'file_with_population_data': "File with population data:",
+            'browse': "Browse",
+            'sample_size': "Sample size:",
+            'strata_column': "Strata column:",
+            'value_column': "Value column:",
+            'use_threshold_value': "Use threshold value?",
+            'threshold_value': "Threshold value:",
+            'use_stratification': "Use stratification?",
+            'continue_tuning': "Continue tuning from the previous run?",
+            'strata_column_for_mus': "Strata column:",
+            'define_column_types': "Define column types",
+            'data_preprocessing_completed': "Data preprocessing completed.",
+            'create_sample': "Create sample",
+            'loading_file': "Loading file...",
+            'error': "Error",
+            'first_load_data': "First, load the data.",
+            'in_dataframe_no_columns_of_type': "No {column_type} columns in the dataframe.",
+            'no_columns_selected_of_type': "No {column_type} columns selected.",
+            'data_preprocessing': "Data preprocessing...",
+            'creating_sample': "Creating sample...",
+            'file_size': "File size",
+            'sample_saved_in_file': "Sample saved in file",
+            'select_columns_of_type': "Select {column_type} columns:",
+            'warning': "Warning",
+            'data_preprocessing_not_done': "Data preprocessing not done. Click 'Define column types' and save your selection.",
+            'no_columns_of_type_selected': "No {column_type} columns selected.",
+            'error_reading_file': "Error reading file",
+            'error_processing_data': "Error processing data",
+            'error_creating_sample': "Failed to create sample or sample is empty.",
+            'hdbscan_limit_error': "HDBSCAN does not support datasets larger than 300,000 rows.",
+            'lof_limit_error': "Local Outlier Factor does not support datasets larger than 1,000,000 rows.",
+            'error_title': "Error",
+            'file_loading_error': "Error reading file",
+            'visualization_error': "Error creating visualization",
+        },
+    }
+
+    # Column type translations for UI elements
+    COLUMN_TYPE_TRANSLATIONS = {
+        'numerical': {'ua': 'числових', 'en': 'numerical'},
+        'categorical': {'ua': 'категоріальних', 'en': 'categorical'}
+    }
+
+    # Define available sampling methods with their names and descriptions in both languages
+    SAMPLING_METHODS = {
+        1: {
+            "name_ua": "Випадкова вибірка",
+            "name_en": "Random Sampling",
+            "description_ua": "кожен елемент генеральної сукупності має рівну ймовірність потрапити у вибірку.",
+            "description_en": "each element of the population has an equal chance of being selected.",
+        },
+        2: {
+            "name_ua": "Систематична вибірка",
+            "name_en": "Systematic Sampling",
+            "description_ua": "елементи вибираються з генеральної сукупності через рівні інтервали.",
+            "description_en": "elements are selected from the population at regular intervals.",
+        },
+        3: {
+            "name_ua": "Стратифікована вибірка",
+            "name_en": "Stratified Sampling",
+            "description_ua": "генеральна сукупність ділиться на страти (групи), і з кожної страти формується випадкова вибірка.",
+            "description_en": "the population is divided into strata, and random samples are taken from each stratum.",
+        },
+        4: {
+            "name_ua": "Метод грошової одиниці",
+            "name_en": "Monetary Unit Sampling",
+            "description_ua": "ймовірність вибору елемента пропорційна його грошовій величині. Використовується для оцінки сумарної величини помилок.",
+            "description_en": "the probability of selecting an item is proportional to its monetary value.",
+        },
+        5: {
+            "name_ua": "Isolation Forest",
+            "name_en": "Isolation Forest",
+            "description_ua": "алгоритм для виявлення аномалій на основі випадкових лісів.",
+            "description_en": "an algorithm for anomaly detection based on random forests.",
+        },
+        6: {
+            "name_ua": "Local Outlier Factor",
+            "name_en": "Local Outlier Factor",
+            "description_ua": "метод для виявлення локальних аномалій у даних.",
+            "description_en": "a method for detecting local anomalies in data.",
+        },
+        7: {
+            "name_ua": "Кластеризація K-Means",
+            "name_en": "K-Means Clustering",
+            "description_ua": "групування даних за схожістю для виявлення незвичайних точок.",
+            "description_en": "grouping data by similarity to detect unusual points.",
+        },
+        8: {
+            "name_ua": "Автоенкодер",
+            "name_en": "Autoencoder",
+            "description_ua": "зменшення розмірності даних для виявлення відхилень через аналіз помилки відновлення.",
+            "description_en": "reducing data dimensionality to detect deviations by analyzing reconstruction error.",
+        },
+        9: {
+            "name_ua": "HDBSCAN",
+            "name_en": "HDBSCAN",
+            "description_ua": "знаходження аномалій, класифікуючи точки як шум, спираючись на їхню щільність і відстань до інших точок, що дозволяє виокремлювати викиди в даних.",
+            "description_en": "finding anomalies by classifying points as noise based on their density and distance to other points.",
+        },
+    }
+
+    # Module and name of the sampling function for each method ID. The modules are
+    # imported on first use because the ML ones pull in torch, optuna and scikit-learn,
+    # which would otherwise delay the application start-up by several seconds.
+    SAMPLING_FUNCTIONS = {
+        1: ("statistical_sampling.random", "random_sampling"),
+        2: ("statistical_sampling.systematic", "systematic_sampling"),
+        3: ("statistical_sampling.stratified", "stratified_sampling"),
+        4: ("statistical_sampling.monetary_unit", "monetary_unit_sampling"),
+        5: ("ml_sampling.isolation_forest", "isolation_forest_sampling"),
+        6: ("ml_sampling.lof", "lof_sampling"),
+        7: ("ml_sampling.kmeans", "kmeans_sampling"),
+        8: ("ml_sampling.autoencoder", "autoencoder_sampling"),
+        9: ("ml_sampling.hdbscan", "hdbscan_sampling"),
+    }
+    # Method IDs of the machine learning methods, which work on preprocessed data
+    ML_METHODS = (5, 6, 7, 8, 9)
+    # Method IDs of the methods tuned with Optuna
+    OPTUNA_METHODS = (7, 9)
+
     def __init__(self):
         """
         Initialize the SamplingApp.
 
-        Sets up the user interface, translation dictionaries, sampling methods,
-        and initializes the main UI components.
+        Sets up the per-instance state and initializes the main UI components.
+        Translations and sampling method descriptions are class-level constants.
         """
         super().__init__()
         self.language = 'ua'  # 'ua' for Ukrainian, 'en' for English
 
-        # Translation dictionaries for UI text
-        self.translations = {
-            'ua': {
-                'window_title': "Створення аудиторських вибірок",
-                'select_sampling_method': "Оберіть тип вибірки:",
-                'file_with_population_data': "Файл з генеральною сукупністю:",
-                'browse': "Огляд",
-                'sample_size': "Розмір вибірки:",
-                'strata_column': "Стовпець для стратифікації:",
-                'value_column': "Стовпець зі значеннями грошових одиниць:",
-                'use_threshold_value': "Використовувати порогове значення?",
-                'threshold_value': "Порогове значення:",
-                'use_stratification': "Використовувати стратифікацію?",
-                'strata_column_for_mus': "Стовпець для стратифікації:",
-                'define_column_types': "Вказати типи колонок",
-                'data_preprocessing_completed': "Передобробка даних виконана.",
-                'create_sample': "Створити вибірку",
-                'loading_file': "Завантаження файлу...",
-                'error': "Помилка",
-                'first_load_data': "Спочатку завантажте дані.",
-                'in_dataframe_no_columns_of_type': "У датафреймі немає {column_type} стовпців.",
-                'no_columns_selected_of_type': "Не вибрано жодного {column_type} стовпця.",
-                'data_preprocessing': "Передобробка даних...",
-                'creating_sample': "Створення вибірки...",
-                'file_size': "Розмір файлу",
-                'sample_saved_in_file': "Вибірку збережено у файлі",
-                'select_columns_of_type': "Виберіть {column_type} стовпці:",
-                'warning': "Попередження",
-                'data_preprocessing_not_done': "Передобробка даних не виконана. Натисніть 'Вказати типи колонок' та збережіть вибір.",
-                'no_columns_of_type_selected': "Не вибрано жодного {column_type} стовпця.",
-                'error_reading_file': "Помилка при читанні файлу",
-                'error_processing_data': "Помилка при обробці даних",
-                'error_creating_sample': "Не вдалося сформувати вибірку або вибірка порожня.",
-                'hdbscan_limit_error': "HDBSCAN не підтримує вибірки більше 300,000 рядків.",
-                'lof_limit_error': "Local Outlier Factor не підтримує вибірки більше 1,000,000 рядків.",
-                'error_title': "Помилка",
-                'file_loading_error': "Помилка при читанні файлу",
-                'visualization_error': "Помилка при створенні візуалізації",
-            },
-            'en': {
-                'window_title': "Audit Sampling Creation",
-                'select_sampling_method': "Select sampling method:",
-                'file_with_population_data': "File with population data:",
-                'browse': "Browse",
-                'sample_size': "Sample size:",
-                'strata_column': "Strata column:",
-                'value_column': "Value column:",
-                'use_threshold_value': "Use threshold value?",
-                'threshold_value': "Threshold value:",
-                'use_stratification': "Use stratification?",
-                'strata_column_for_mus': "Strata column:",
-                'define_column_types': "Define column types",
-                'data_preprocessing_completed': "Data preprocessing completed.",
-                'create_sample': "Create sample",
-                'loading_file': "Loading file...",
-                'error': "Error",
-                'first_load_data': "First, load the data.",
-                'in_dataframe_no_columns_of_type': "No {column_type} columns in the dataframe.",
-                'no_columns_selected_of_type': "No {column_type} columns selected.",
-                'data_preprocessing': "Data preprocessing...",
-                'creating_sample': "Creating sample...",
-                'file_size': "File size",
-                'sample_saved_in_file': "Sample saved in file",
-                'select_columns_of_type': "Select {column_type} columns:",
-                'warning': "Warning",
-                'data_preprocessing_not_done': "Data preprocessing not done. Click 'Define column types' and save your selection.",
-                'no_columns_of_type_selected': "No {column_type} columns selected.",
-                'error_reading_file': "Error reading file",
-                'error_processing_data': "Error processing data",
-                'error_creating_sample': "Failed to create sample or sample is empty.",
-                'hdbscan_limit_error': "HDBSCAN does not support datasets larger than 300,000 rows.",
-                'lof_limit_error': "Local Outlier Factor does not support datasets larger than 1,000,000 rows.",
-                'error_title': "Error",
-                'file_loading_error': "Error reading file",
-                'visualization_error': "Error creating visualization",
-            },
-        }
-
-        # Column type translations for UI elements
-        self.column_type_translations = {
-            'numerical': {'ua': 'числових', 'en': 'numerical'},
-            'categorical': {'ua': 'категоріальних', 'en': 'categorical'}
-        }
-
         # Initialize data-related attributes
         self.data = None  # Raw data loaded from file
+        self._loaded_path = None  # Path of the file currently held in self.data
         self.data_preprocessed = None  # Data after preprocessing
+        self._preprocessing_key = None  # Inputs that produced data_preprocessed
+        self._studies = {}  # Last Optuna study per method ID, for the current data_preprocessed
+        self.continue_tuning = False  # Flag to continue the previous Optuna study
         self.numerical_columns = []  # List of selected numerical columns
         self.categorical_columns = []  # List of selected categorical columns
         self.use_threshold = False  # Flag to use threshold in sampling
         self.use_stratify = False  # Flag to use stratification in sampling
         self.preprocessing_method_description = ""  # Description of preprocessing steps
         self.widgets = {}  # Dictionary to hold references to UI widgets
-
-        # Define available sampling methods with their names and descriptions in both languages
-        self.sampling_methods = {
-            1: {
-                "name_ua": "Випадкова вибірка",
-                "name_en": "Random Sampling",
-                "description_ua": "кожен елемент генеральної сукупності має рівну ймовірність потрапити у вибірку.",
-                "description_en": "each element of the population has an equal chance of being selected.",
-            },
-            2: {
-                "name_ua": "Систематична вибірка",
-                "name_en": "Systematic Sampling",
-                "description_ua": "елементи вибираються з генеральної сукупності через рівні інтервали.",
-                "description_en": "elements are selected from the population at regular intervals.",
-            },
-            3: {
-                "name_ua": "Стратифікована вибірка",
-                "name_en": "Stratified Sampling",
-                "description_ua": "генеральна сукупність ділиться на страти (групи), і з кожної страти формується випадкова вибірка.",
-                "description_en": "the population is divided into strata, and random samples are taken from each stratum.",
-            },
-            4: {
-                "name_ua": "Метод грошової одиниці",
-                "name_en": "Monetary Unit Sampling",
-                "description_ua": "ймовірність вибору елемента пропорційна його грошовій величині. Використовується для оцінки сумарної величини помилок.",
-                "description_en": "the probability of selecting an item is proportional to its monetary value.",
-            },
-            5: {
-                "name_ua": "Isolation Forest",
-                "name_en": "Isolation Forest",
-                "description_ua": "алгоритм для виявлення аномалій на основі випадкових лісів.",
-                "description_en": "an algorithm for anomaly detection based on random forests.",
-            },
-            6: {
-                "name_ua": "Local Outlier Factor",
-                "name_en": "Local Outlier Factor",
-                "description_ua": "метод для виявлення локальних аномалій у даних.",
-                "description_en": "a method for detecting local anomalies in data.",
-            },
-            7: {
-                "name_ua": "Кластеризація K-Means",
-                "name_en": "K-Means Clustering",
-                "description_ua": "групування даних за схожістю для виявлення незвичайних точок.",
-                "description_en": "grouping data by similarity to detect unusual points.",
-            },
-            8: {
-                "name_ua": "Автоенкодер",
-                "name_en": "Autoencoder",
-                "description_ua": "зменшення розмірності даних для виявлення відхилень через аналіз помилки відновлення.",
-                "description_en": "reducing data dimensionality to detect deviations by analyzing reconstruction error.",
-            },
-            9: {
-                "name_ua": "HDBSCAN",
-                "name_en": "HDBSCAN",
-                "description_ua": "знаходження аномалій, класифікуючи точки як шум, спираючись на їхню щільність і відстань до інших точок, що дозволяє виокремлювати викиди в даних.",
-                "description_en": "finding anomalies by classifying points as noise based on their density and distance to other points.",
-            },
-        }
+        self._pending_tasks = set()  # Unfinished parts of the current sampling run
+        self._result_received = False  # Whether the sampling worker emitted a result
+        self._export_failed = False  # Whether writing the CSV files failed
+        self._report_path = None  # Path of the PDF report of the current run
+        self._last_choice = None  # Sampling method the option widgets are laid out for
 
         # Initialize the user interface
         self.init_ui()
@@ -214,7 +236,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         Returns:
             str: Translated string corresponding to the key.
         """
-        return self.translations[self.language][key]
+        return self.TRANSLATIONS[self.language][key]
 
     def translate_column_type(self, column_type: str) -> str:
         """
@@ -226,7 +248,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         Returns:
             str: Translated column type.
         """
-        return self.column_type_translations[column_type][self.language]
+        return self.COLUMN_TYPE_TRANSLATIONS[column_type][self.language]
 
     def init_ui(self):
         """
@@ -309,7 +331,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         self.method_group.setLayout(self.method_layout)
         self.method_buttons = []
         self.method_button_group = QtWidgets.QButtonGroup()
-        for key, method in self.sampling_methods.items():
+        for key, method in self.SAMPLING_METHODS.items():
             radio_button = QtWidgets.QRadioButton()
             radio_button.setChecked(key == 1)  # Set first method as default
             self.method_button_group.addButton(radio_button, key)
@@ -392,12 +414,36 @@ class SamplingApp(QtWidgets.QMainWindow):
         self.preprocess_label.setVisible(False)
         self.options_layout.addRow(self.preprocess_label)
 
+        # Continue Tuning Components
+        self.continue_tuning_checkbox = QtWidgets.QCheckBox(
+            self.t('continue_tuning'))
+        self.continue_tuning_checkbox.toggled.connect(
+            self.toggle_continue_tuning)
+        self.options_layout.addRow(self.continue_tuning_checkbox)
+
         # Spacer to prevent layout shrinking
         self.options_layout.addItem(
             QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding))
 
         main_layout.addWidget(self.options_group)
 
+        # Widgets that are only shown for some sampling methods
+        self.method_option_widgets = [
+            self.strata_label,
+            self.strata_combo,
+            self.value_label,
+            self.value_combo,
+            self.use_threshold_checkbox,
+            self.threshold_label,
+            self.threshold_input,
+            self.use_stratify_checkbox,
+            self.mus_strata_label,
+            self.mus_strata_combo,
+            self.column_types_button,
+            self.preprocess_label,
+            self.continue_tuning_checkbox,
+        ]
+
         # Create Sample Button
         self.create_button = QtWidgets.QPushButton(
             self.t('create_sample'))
@@ -452,7 +498,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         # Update method descriptions with translated text
         for idx, radio_button in enumerate(self.method_buttons):
             key = idx + 1
-            method = self.sampling_methods[key]
+            method = self.SAMPLING_METHODS[key]
             if self.language == 'ua':
                 text = f"{method['name_ua']}: {method['description_ua']}"
             else:
@@ -473,6 +519,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         self.mus_strata_label.setText(self.t('strata_column_for_mus'))
         self.column_types_button.setText(self.t('define_column_types'))
         self.preprocess_label.setText(self.t('data_preprocessing_completed'))
+        self.continue_tuning_checkbox.setText(self.t('continue_tuning'))
         self.create_button.setText(self.t('create_sample'))
         self.status_label.setText("")
 
@@ -509,6 +556,9 @@ class SamplingApp(QtWidgets.QMainWindow):
             self.file_loader_worker.result_ready.connect(
                 self.handle_file_loaded)
             self.file_loader_worker.error.connect(self.handle_file_error)
+            self.file_loader_worker.progress.connect(self.update_progress_bar)
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(True)
             self.file_loader_thread.start()
 
     def populate_column_dropdowns(self):
@@ -518,8 +568,8 @@ class SamplingApp(QtWidgets.QMainWindow):
         Numerical columns are added to the value column dropdown, while all columns are added to the strata dropdowns.
         """
         try:
-            numerical_columns = [
-                col for col in self.data.columns if pd.api.types.is_numeric_dtype(self.data[col])]
+            numerical_columns = self.data.select_dtypes(
+                include=['number', 'bool']).columns.tolist()
             self.value_combo.clear()
             self.value_combo.addItems(numerical_columns)
             columns = list(self.data.columns)
@@ -538,44 +588,41 @@ class SamplingApp(QtWidgets.QMainWindow):
         Different sampling methods require different parameters; this method ensures that only relevant UI elements are visible.
         """
         choice = self.method_button_group.checkedId()
+        # Clicking the already selected method leaves the layout unchanged; the
+        # checkboxes and preprocessing keep their own widgets up to date
+        if choice == self._last_choice:
+            return
+        self._last_choice = choice
         self.sample_size_label.setVisible(True)
         self.sample_size_input.setVisible(True)
-        self.strata_label.setVisible(False)
-        self.strata_combo.setVisible(False)
-        self.value_label.setVisible(False)
-        self.value_combo.setVisible(False)
-        self.use_threshold_checkbox.setVisible(False)
-        self.threshold_label.setVisible(False)
-        self.threshold_input.setVisible(False)
-        self.use_stratify_checkbox.setVisible(False)
-        self.mus_strata_label.setVisible(False)
-        self.mus_strata_combo.setVisible(False)
-        self.column_types_button.setVisible(False)
-        self.preprocess_label.setVisible(False)
 
+        # Work out the final visibility first so each widget is shown or hidden
+        # once, instead of hiding everything and showing part of it again
+        visibility = {widget: False for widget in self.method_option_widgets}
         if choice == 3:
             # Stratified Sampling requires strata column selection
-            self.strata_label.setVisible(True)
-            self.strata_combo.setVisible(True)
+            visibility[self.strata_label] = True
+            visibility[self.strata_combo] = True
         elif choice == 4:
             # Monetary Unit Sampling requires value column and optional threshold
-            self.value_label.setVisible(True)
-            self.value_combo.setVisible(True)
-            self.use_threshold_checkbox.setVisible(True)
-            self.threshold_label.setVisible(
-                self.use_threshold_checkbox.isChecked())
-            self.threshold_input.setVisible(
-                self.use_threshold_checkbox.isChecked())
-            self.use_stratify_checkbox.setVisible(True)
-            self.mus_strata_label.setVisible(
-                self.use_stratify_checkbox.isChecked())
-            self.mus_strata_combo.setVisible(
-                self.use_stratify_checkbox.isChecked())
-        elif choice in (5, 6, 7, 8, 9):
+            use_threshold = self.use_threshold_checkbox.isChecked()
+            use_stratify = self.use_stratify_checkbox.isChecked()
+            visibility[self.value_label] = True
+            visibility[self.value_combo] = True
+            visibility[self.use_threshold_checkbox] = True
+            visibility[self.threshold_label] = use_threshold
+            visibility[self.threshold_input] = use_threshold
+            visibility[self.use_stratify_checkbox] = True
+            visibility[self.mus_strata_label] = use_stratify
+            visibility[self.mus_strata_combo] = use_stratify
+        elif choice in self.ML_METHODS:
             # Advanced sampling methods require defining column types
-            self.column_types_button.setVisible(True)
-            if self.data_preprocessed is not None:
-                self.preprocess_label.setVisible(True)
+            visibility[self.column_types_button] = True
+            visibility[self.preprocess_label] = self.data_preprocessed is not None
+            visibility[self.continue_tuning_checkbox] = choice in self.OPTUNA_METHODS
+
+        for widget, visible in visibility.items():
+            widget.setVisible(visible)
 
     def toggle_threshold_input(self):
         """
@@ -597,6 +644,12 @@ class SamplingApp(QtWidgets.QMainWindow):
         self.mus_strata_label.setVisible(self.use_stratify)
         self.mus_strata_combo.setVisible(self.use_stratify)
 
+    def toggle_continue_tuning(self):
+        """
+        Store whether the next Optuna run continues the previous study of the selected method.
+        """
+        self.continue_tuning = self.continue_tuning_checkbox.isChecked()
+
     def define_column_types(self):
         """
         Open dialogs for the user to define numerical and categorical columns.
@@ -618,12 +671,13 @@ class SamplingApp(QtWidgets.QMainWindow):
             columns = self.data.columns.tolist()
             if column_type == "numerical":
                 # Filter columns that are numerical
-                columns = [col for col in self.data.columns if pd.api.types.is_numeric_dtype(
-                    self.data[col])]
+                columns = self.data.select_dtypes(
+                    include=['number', 'bool']).columns.tolist()
             elif column_type == "categorical":
                 # Exclude numerical columns to get categorical columns
+                numerical = set(self.numerical_columns)
                 columns = [
-                    col for col in self.data.columns if col not in self.numerical_columns]
+                    col for col in self.data.columns if col not in numerical]
 
             if not columns:
                 QtWidgets.QMessageBox.critical(
@@ -644,6 +698,8 @@ class SamplingApp(QtWidgets.QMainWindow):
             list_widget = QtWidgets.QListWidget()
             list_widget.setSelectionMode(
                 QtWidgets.QAbstractItemView.MultiSelection)
+            # All rows are single-line text, so skip per-item size measurement
+            list_widget.setUniformItemSizes(True)
             list_widget.addItems(columns)
             dialog_layout.addWidget(list_widget)
 
@@ -667,7 +723,15 @@ class SamplingApp(QtWidgets.QMainWindow):
                     # After selecting numerical columns, prompt for categorical
                     select_columns("categorical")
                 else:
+                    # Skip preprocessing if the data and selected columns are unchanged
+                    preprocessing_key = (id(self.data), tuple(self.numerical_columns),
+                                         tuple(self.categorical_columns))
+                    if self.data_preprocessed is not None and preprocessing_key == self._preprocessing_key:
+                        self.preprocess_label.setVisible(True)
+                        return
+
                     # After selecting categorical columns, start preprocessing
+                    self._pending_preprocessing_key = preprocessing_key
                     self.status_label.setText(
                         self.t('data_preprocessing'))
                     self.preprocessing_worker = PreprocessingWorker(
@@ -718,10 +782,16 @@ class SamplingApp(QtWidgets.QMainWindow):
             self.create_button.setEnabled(True)
             self.progress_bar.setVisible(False)
             return
-        population = self.data.copy()
-        self.data = population
+        # Reuse the DataFrame parsed by FileLoaderWorker instead of copying or
+        # re-reading it; the sampling functions make their own working copies.
+        if self.data is None or file_path != self._loaded_path:
+            QtWidgets.QMessageBox.critical(
+                self, self.t('error'), self.t('first_load_data'))
+            self.create_button.setEnabled(True)
+            self.progress_bar.setVisible(False)
+            return
 
-        dataset_size = population.shape[0]
+        dataset_size = self.data.shape[0]
         # Check dataset size limits for specific sampling methods
         if choice == 9 and dataset_size > 300000:
             QtWidgets.QMessageBox.warning(self, self.t('error'), self.t(
@@ -737,10 +807,16 @@ class SamplingApp(QtWidgets.QMainWindow):
             return
 
         # Retrieve the sampling function and parameters based on the selected method
-        method_info = self.sampling_methods.get(choice)
+        method_info = self.SAMPLING_METHODS.get(choice)
         sampling_function = self.get_sampling_function(choice)
         kwargs = self.get_sampling_parameters(choice)
 
+        # The run is complete once both the CSV export and the report are done
+        self._pending_tasks = {'export', 'report'}
+        self._result_received = False
+        self._export_failed = False
+        self._report_path = None
+
         # Create a worker and thread for sampling to prevent UI blocking
         self.worker = Worker(sampling_function, kwargs, choice,
                              method_info, file_path)
@@ -755,30 +831,23 @@ class SamplingApp(QtWidgets.QMainWindow):
         self.worker.error.connect(self.handle_worker_error)
         self.worker.progress.connect(self.update_progress_bar)
         self.worker.result_ready.connect(self.process_sampling_result)
+        self.worker.finished.connect(self.handle_worker_finished)
         self.thread.start()
 
     def get_sampling_function(self, choice: int):
         """
         Retrieve the sampling function based on the selected method.
 
+        The module defining the function is imported on the first call.
+
         Args:
             choice (int): The ID of the selected sampling method.
 
         Returns:
             Callable: The corresponding sampling function.
         """
-        sampling_functions = {
-            1: random_sampling,
-            2: systematic_sampling,
-            3: stratified_sampling,
-            4: monetary_unit_sampling,
-            5: isolation_forest_sampling,
-            6: lof_sampling,
-            7: kmeans_sampling,
-            8: autoencoder_sampling,
-            9: hdbscan_sampling,
-        }
-        return sampling_functions.get(choice)
+        module_name, function_name = self.SAMPLING_FUNCTIONS[choice]
+        return getattr(importlib.import_module(module_name), function_name)
 
     def get_sampling_parameters(self, choice: int) -> dict:
         """
@@ -791,7 +860,10 @@ class SamplingApp(QtWidgets.QMainWindow):
             dict: A dictionary of parameters for the sampling function.
         """
         params = {}
-        params["random_seed"] = random.randint(1, 10000)
+        # Draw a fresh 32-bit seed from OS entropy; it is reported in the method
+        # description so the sample can be reproduced
+        params["random_seed"] = int(
+            np.random.SeedSequence().generate_state(1)[0])
         params["sample_size"] = int(self.sample_size_input.text())
         params["data"] = self.data  # Include data here
 
@@ -810,7 +882,7 @@ class SamplingApp(QtWidgets.QMainWindow):
                 params["strata_column"] = self.mus_strata_combo.currentText()
             else:
                 params["strata_column"] = None
-        elif choice in (5, 6, 7, 8, 9):
+        elif choice in self.ML_METHODS:
             # Advanced sampling methods require preprocessed data and selected features
             if not self.numerical_columns and not self.categorical_columns:
                 raise ValueError(
@@ -824,21 +896,35 @@ class SamplingApp(QtWidgets.QMainWindow):
             params["data_preprocessed"] = self.data_preprocessed
             params["features"] = self.numerical_columns + \
                 self.categorical_columns
+            if self.continue_tuning and choice in self._studies:
+                # Continue the previous study on the same preprocessed data with the seed
+                # its trials were run with, so the reported seed still reproduces the run
+                previous_study = self._studies[choice]
+                params["random_seed"] = previous_study.user_attrs["random_seed"]
+                params["warm_start_trials"] = previous_study.trials
         return params
 
-    @QtCore.Slot(pd.DataFrame)
-    def handle_file_loaded(self, data: pd.DataFrame):
+    @QtCore.Slot(pd.DataFrame, str)
+    def handle_file_loaded(self, data: pd.DataFrame, file_path: str):
         """
         Handle the event when the file is successfully loaded.
 
         Args:
             data (pd.DataFrame): The loaded data as a pandas DataFrame.
+            file_path (str): Path of the file the data was read from.
         """
         self.data = data
+        # Take the path from the signal: self.file_loader_worker is the latest
+        # worker, which may not be the one that loaded this data
+        self._loaded_path = file_path
+        # A new DataFrame may reuse the id() of the old one, so forget the key
+        self._preprocessing_key = None
+        self._studies = {}
         self.populate_column_dropdowns()
         shape_text = f"{self.t('file_size')}: {self.data.shape}"
         self.file_shape_label.setText(shape_text)
         self.status_label.setText("")
+        self.progress_bar.setVisible(False)
 
     @QtCore.Slot(str)
     def handle_file_error(self, error_message: str):
@@ -849,6 +935,7 @@ class SamplingApp(QtWidgets.QMainWindow):
             error_message (str): The error message describing what went wrong.
         """
         self.status_label.setText("")
+        self.progress_bar.setVisible(False)
         QtWidgets.QMessageBox.critical(
             self, self.t('error'), f"{self.t('file_loading_error')}: {error_message}")
 
@@ -861,6 +948,8 @@ class SamplingApp(QtWidgets.QMainWindow):
             result (tuple): A tuple containing the preprocessed data and a description of the preprocessing method.
         """
         self.data_preprocessed, self.preprocessing_method_description = result
+        self._preprocessing_key = self._pending_preprocessing_key
+        self._studies = {}
         self.preprocess_label.setVisible(True)
         self.status_label.setText("")
 
@@ -894,12 +983,42 @@ class SamplingApp(QtWidgets.QMainWindow):
         Args:
             error_message (str): The error message describing what went wrong.
         """
-        self.create_button.setEnabled(True)
+        self._export_failed = True
+        if not self._result_received:
+            # Sampling itself failed, so no report will be generated
+            self.complete_task('report')
         self.status_label.setText("")
         self.progress_bar.setVisible(False)
         QtWidgets.QMessageBox.critical(
             self, self.t('error'), error_message)
 
+    @QtCore.Slot()
+    def handle_worker_finished(self):
+        """
+        Handle the end of the sampling worker, after the CSV files are written or an error occurred.
+        """
+        self.complete_task('export')
+
+    def complete_task(self, task: str):
+        """
+        Mark a part of the current sampling run as done.
+
+        The CSV export runs concurrently with chart and report generation. Once both are
+        done, the create button is re-enabled and, if everything succeeded, the path of
+        the generated report is shown.
+
+        Args:
+            task (str): The finished task ('export' or 'report').
+        """
+        self._pending_tasks.discard(task)
+        if self._pending_tasks:
+            return
+        self.create_button.setEnabled(True)
+        self.status_label.setText("")
+        if self._report_path and not self._export_failed:
+            message = f"{self.t('sample_saved_in_file')}:\n{self._report_path}"
+            self.result_label.setText(message)
+
     @QtCore.Slot(object)
     def process_sampling_result(self, result_tuple: tuple):
         """
@@ -909,15 +1028,15 @@ class SamplingApp(QtWidgets.QMainWindow):
             result_tuple (tuple): A tuple containing the sampling results and related information.
         """
         result, method_info, file_path, choice = result_tuple
-        self.create_button.setEnabled(True)
+        self._result_received = True
         self.status_label.setText("")
         self.progress_bar.setVisible(False)
 
         try:
             # Unpack result based on sampling method
-            if choice in (1, 2, 3, 4):
+            if choice not in self.ML_METHODS:
                 population_with_results, sample, sampling_method_description = result
-            elif choice in (5, 6, 7, 8, 9):
+            else:
                 (
                     population_with_results,
                     population_for_chart,
@@ -925,6 +1044,8 @@ class SamplingApp(QtWidgets.QMainWindow):
                     sampling_method_description,
                 ) = result[:4]
                 best_study = result[4] if len(result) > 4 else None
+                if best_study is not None:
+                    self._studies[choice] = best_study
 
             if sample is None or sample.empty:
                 raise ValueError(
@@ -936,14 +1057,7 @@ class SamplingApp(QtWidgets.QMainWindow):
             sample_type = method_info["name_en"].lower().replace(" ", "_")
             output_path_en = f"{file_name}_{sample_type}.pdf"
 
-            sample_output_path = f"{file_name}_{sample_type}_sample.csv"
-            population_output_path = f"{file_name}_{sample_type}_population.csv"
-
-            # Save the population and sample data to CSV files
-            population_with_results.to_csv(
-                population_output_path, index=False)
-            sample.to_csv(sample_output_path, index=False)
-
+            # The population and sample CSV files are written by the sampling worker
             chart_paths = []
 
             # Retrieve parameters used during sampling
@@ -992,11 +1106,10 @@ class SamplingApp(QtWidgets.QMainWindow):
                 cumulative_chart_files = glob.glob(pattern)
                 chart_paths.extend(cumulative_chart_files)
 
-            if choice in (5, 6, 7, 8, 9):
+            if choice in self.ML_METHODS:
                 # Start UMAP visualization in a separate thread
                 self.status_label.setText(
                     self.t("data_preprocessing"))
-                self.create_button.setEnabled(False)
                 visualization_args = [population_for_chart]
                 visualization_kwargs = {
                     "label_column": "is_sample",
@@ -1030,6 +1143,7 @@ class SamplingApp(QtWidgets.QMainWindow):
 
         except Exception as e:
             logger.exception("Error occurred while processing result")
+            self.complete_task('report')
             QtWidgets.QMessageBox.critical(
                 self, self.t('error'), str(e))
 
@@ -1041,8 +1155,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         Args:
             error_message (str): The error message describing what went wrong.
         """
-        self.create_button.setEnabled(True)
-        self.status_label.setText("")
+        self.complete_task('report')
         QtWidgets.QMessageBox.critical(
             self, self.t('error'), self.t('visualization_error') + ": " + error_message)
 
@@ -1060,17 +1173,14 @@ class SamplingApp(QtWidgets.QMainWindow):
             sample_type (str): Type of sampling method in lowercase with underscores.
             best_study (object): Best study object from sampling (if applicable).
         """
-        self.create_button.setEnabled(True)
-        self.status_label.setText("")
-
         # Add UMAP visualization to chart_paths if applicable
-        if choice in (5, 6, 7, 8, 9):
+        if choice in self.ML_METHODS:
             umap_projection_path = (
                 f"{file_name}_{sample_type}_umap_projection.png"
             )
             chart_paths.append(umap_projection_path)
 
-            if choice in (7, 9) and best_study:
+            if choice in self.OPTUNA_METHODS and best_study:
                 # Generate and add Optuna results visualizations
                 base_optuna_results_path = (
                     f"{file_name}_{sample_type}_optuna_results"
@@ -1083,7 +1193,6 @@ class SamplingApp(QtWidgets.QMainWindow):
 
         # Start PDF generation in a separate thread
         self.status_label.setText(self.t('creating_sample'))
-        self.create_button.setEnabled(False)
 
         self.pdf_worker = PdfGenerationWorker(
             output_path_en,
@@ -1109,12 +1218,11 @@ class SamplingApp(QtWidgets.QMainWindow):
         """
         Handle the completion of the PDF generation process.
 
-        Displays a success message with the path to the generated PDF.
+        The success message with the path to the generated PDF is shown once the
+        CSV export has finished as well.
         """
-        self.create_button.setEnabled(True)
-        self.status_label.setText("")
-        message = f"{self.t('sample_saved_in_file')}:\n{self.pdf_worker.output_path}"
-        self.result_label.setText(message)
+        self._report_path = self.pdf_worker.output_path
+        self.complete_task('report')
 
     @QtCore.Slot(str)
     def handle_pdf_error(self, error_message: str):
@@ -1124,8 +1232,7 @@ class SamplingApp(QtWidgets.QMainWindow):
         Args:
             error_message (str): The error message describing what went wrong.
         """
-        self.create_button.setEnabled(True)
-        self.status_label.setText("")
+        self.complete_task('report')
         QtWidgets.QMessageBox.critical(self, self.t('error'), error_message)
 
     def closeEvent(self, event):
@@ -1153,20 +1260,24 @@ class SamplingApp(QtWidgets.QMainWindow):
     - **Purpose**: Serves as the main window for the application, managing the user interface and orchestrating the sampling process.
     - **Attributes**:
         - `language`: Current language of the UI (`'ua'` for Ukrainian, `'en'` for English).
-        - `translations`: Dictionary containing translations for UI elements.
-        - `column_type_translations`: Dictionary for translating column types.
+        - `TRANSLATIONS`: Class-level dictionary containing translations for UI elements.
+        - `COLUMN_TYPE_TRANSLATIONS`: Class-level dictionary for translating column types.
         - `data`: Loaded population data.
         - `data_preprocessed`: Data after preprocessing.
         - `numerical_columns`: Selected numerical columns for analysis.
         - `categorical_columns`: Selected categorical columns for analysis.
         - `use_threshold`: Flag indicating whether to use a threshold value.
         - `use_stratify`: Flag indicating whether to use stratification.
+        - `continue_tuning`: Flag indicating whether to continue the previous Optuna study.
         - `preprocessing_method_description`: Description of the preprocessing steps applied.
         - `widgets`: Dictionary to store references to various UI widgets.
-        - `sampling_methods`: Dictionary defining available sampling methods with their names and descriptions.
+        - `SAMPLING_METHODS`: Class-level dictionary defining available sampling methods with their names and descriptions.
+        - `method_option_widgets`: Widgets that are shown only for some sampling methods.
+        - `SAMPLING_FUNCTIONS`: Class-level mapping of method IDs to the module and name of their sampling function.
+        - `ML_METHODS` / `OPTUNA_METHODS`: Class-level tuples of method IDs grouped by how they are run.
 
 2. **Methods**:
-    - **`__init__`**: Initializes the application, sets up translations, sampling methods, and the UI.
+    - **`__init__`**: Initializes the application state and the UI.
     - **`t`**: Helper method to retrieve translated text based on the current language.
     - **`translate_column_type`**: Translates column types (`'numerical'` or `'categorical'`) based on the current language.
     - **`init_ui`**: Constructs the user interface, including layouts, widgets, and styles.
@@ -1177,9 +1288,10 @@ class SamplingApp(QtWidgets.QMainWindow):
     - **`on_method_change`**: Adjusts visible UI components based on the selected sampling method.
     - **`toggle_threshold_input`**: Shows or hides threshold input fields based on user selection.
     - **`toggle_stratify_input`**: Shows or hides stratification column selection based on user selection.
+    - **`toggle_continue_tuning`**: Stores whether the next Optuna run continues the previous study.
     - **`define_column_types`**: Opens dialogs for the user to select numerical and categorical columns and starts data preprocessing.
     - **`create_sample`**: Initiates the sample creation process, handling parameter validation and starting the sampling worker.
-    - **`get_sampling_function`**: Retrieves the appropriate sampling function based on user selection.
+    - **`get_sampling_function`**: Imports and retrieves the appropriate sampling function based on user selection.
     - **`get_sampling_parameters`**: Prepares parameters required for the selected sampling method.
     - **`handle_file_loaded`**: Processes the loaded data, updating UI elements accordingly.
     - **`handle_file_error`**: Displays an error message if file loading fails.
@@ -1187,6 +1299,8 @@ class SamplingApp(QtWidgets.QMainWindow):
     - **`handle_preprocessing_error`**: Handles errors that occur during data preprocessing.
     - **`update_progress_bar`**: Updates the progress bar's value during long-running operations.
     - **`handle_worker_error`**: Handles errors that occur during the sampling process.
+    - **`handle_worker_finished`**: Marks the CSV export of the current run as done.
+    - **`complete_task`**: Tracks the concurrent CSV export and report generation and reports completion once both are done.
     - **`process_sampling_result`**: Processes the results from the sampling worker, including saving data and generating visualizations.
     - **`handle_visualization_error`**: Handles errors that occur during the visualization process.
     - **`finalize_process`**: Completes the sampling process by generating visualizations and creating a PDF report.
@@ -1195,7 +1309,7 @@ class SamplingApp(QtWidgets.QMainWindow):
     - **`closeEvent`**: Ensures that all worker threads are properly terminated when the application window is closed.
 
 3. **Worker Classes**:
-    - **`Worker`**: Handles the execution of the sampling function in a separate thread.
+    - **`Worker`**: Handles the execution of the sampling function and saving of the CSV results in a separate thread.
     - **`FileLoaderWorker`**: Handles loading data files in a separate thread to prevent UI blocking.
     - **`PreprocessingWorker`**: Manages data preprocessing tasks in a separate thread.
     - **`VisualizationWorker`**: Handles the creation of visualizations in a separate thread.
@@ -2,7 +2,6 @@ import os
 import logging
 import pandas as pd
 from PySide6 import QtCore
-from utils.preprocessing import preprocess_data
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
@@ -13,6 +12,13 @@ try:
 except ImportError:
     DBF = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
 # Configure logging to output debug information with timestamps and log levels
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -20,12 +26,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def write_csv(df, path):
+    """
+    Write a DataFrame to a CSV file without the index.
+
+    Uses pyarrow's multithreaded CSV writer when it is installed, which is considerably
+    faster than pandas' row-by-row formatting on large frames. Falls back to
+    DataFrame.to_csv when pyarrow is missing or cannot convert the frame
+    (e.g. object columns holding mixed types).
+
+    Boolean columns are written as True/False, as with to_csv. pyarrow otherwise
+    formats some values differently from to_csv (see the README).
+
+    Args:
+        df (pd.DataFrame): The DataFrame to save.
+        path (str): Path of the output CSV file.
+    """
+    if pa_csv is not None:
+        try:
+            # pyarrow writes booleans as true/false; keep pandas' True/False
+            bool_positions = [i for i, dtype in enumerate(df.dtypes)
+                              if pd.api.types.is_bool_dtype(dtype)]
+            if bool_positions:
+                df = df.copy(deep=False)
+                for i in bool_positions:
+                    df.isetitem(i, df.iloc[:, i].map(
+                        {True: 'True', False: 'False'}))
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(
+                table, path, write_options=pa_csv.WriteOptions(quoting_style="needed"))
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.warning(
+                f"pyarrow could not write {path}, falling back to pandas: {e}")
+    df.to_csv(path, index=False, chunksize=65536)
+
+
 class Worker(QtCore.QObject):
     """
     Worker class to handle sampling operations in a separate thread.
 
     This class executes the sampling function with the provided parameters
-    and emits signals upon completion, error, or progress updates.
+    and emits signals upon completion, error, or progress updates. The result is
+    emitted before the CSV files are written, so `finished` marks the end of the export.
     """
 
     # Define signals
@@ -113,9 +156,13 @@ class Worker(QtCore.QObject):
                 params.pop('sample_size', None)
                 result = sampling_function(data, sample_size, **params)
 
-            # Emit the result ready signal with relevant data
+            # Emit the result first so that charts and the report are generated
+            # while the CSV files are being written
             self.result_ready.emit((result, self.method_info,
                                     self.file_path, self.choice))
+
+            # Write the CSV outputs here so the UI thread is not blocked by them
+            self.save_results(result)
         except Exception as e:
             logger.exception(self.t('error_in_worker_thread'))
             # Emit error signal with translated error message
@@ -124,6 +171,29 @@ class Worker(QtCore.QObject):
             # Emit finished signal regardless of success or failure
             self.finished.emit()
 
+    def save_results(self, result):
+        """
+        Save the population and the sample returned by the sampling function to CSV files.
+
+        The files are written next to the input file. Nothing is written when the
+        sample is empty; the UI reports that case after the result is emitted.
+
+        Args:
+            result (tuple): The tuple returned by the sampling function.
+        """
+        if self.choice in (5, 6, 7, 8, 9):
+            population_with_results, sample = result[0], result[2]
+        else:
+            population_with_results, sample = result[0], result[1]
+        if sample is None or sample.empty:
+            return
+
+        file_name, _ = os.path.splitext(self.file_path)
+        sample_type = self.method_info["name_en"].lower().replace(" ", "_")
+        write_csv(population_with_results,
+                  f"{file_name}_{sample_type}_population.csv")
+        write_csv(sample, f"{file_name}_{sample_type}_sample.csv")
+
 
 class FileLoaderWorker(QtCore.QObject):
     """
@@ -141,13 +211,16 @@ class FileLoaderWorker(QtCore.QObject):
     Signals:
         finished: Emitted when the loading process is finished, regardless of success.
         error (str): Emitted when an error occurs, carrying the error message.
-        result_ready (pd.DataFrame): Emitted when data is successfully loaded, carrying the DataFrame.
+        result_ready (pd.DataFrame, str): Emitted when data is successfully loaded, carrying the
+            DataFrame and the path of the file it was read from.
+        progress (int): Emitted while a CSV file is parsed, carrying the percentage of bytes read.
     """
 
     # Signals
     finished = QtCore.Signal()
     error = QtCore.Signal(str)
-    result_ready = QtCore.Signal(pd.DataFrame)
+    result_ready = QtCore.Signal(pd.DataFrame, str)
+    progress = QtCore.Signal(int)  # Emit percentage of the CSV file parsed
 
     def __init__(self, file_path, language='ua'):
         """
@@ -195,7 +268,7 @@ class FileLoaderWorker(QtCore.QObject):
         emits signals accordingly.
 
         Emits:
-            result_ready (pd.DataFrame): When data is successfully loaded.
+            result_ready (pd.DataFrame, str): When data is successfully loaded.
             error (str): When an error occurs during file loading.
             finished: After the loading process is completed, regardless of success.
         """
@@ -220,8 +293,9 @@ class FileLoaderWorker(QtCore.QObject):
                 # Attempt to read as CSV with common encodings and delimiters
                 data = self.read_csv_file(self.file_path)
 
-            # Emit the loaded data
-            self.result_ready.emit(data)
+            # Emit the loaded data with its path, so that the receiver can tell
+            # which of several loads in flight it comes from
+            self.result_ready.emit(data, self.file_path)
         except Exception as e:
             logger.exception(self.t('error_loading_file'))
             # Emit error signal with translated error message
@@ -236,6 +310,8 @@ class FileLoaderWorker(QtCore.QObject):
 
         This method attempts to read the CSV file using combinations of common
         encodings and delimiters until it succeeds or exhausts all options.
+        The file is parsed in chunks, emitting the share of bytes read so far
+        through the progress signal.
 
         Args:
             file_path (str): Path to the CSV file.
@@ -252,10 +328,34 @@ class FileLoaderWorker(QtCore.QObject):
         for encoding in encodings:
             for delimiter in delimiters:
                 try:
-                    chunk_iter = pd.read_csv(
-                        file_path, encoding=encoding, delimiter=delimiter, chunksize=100000
+                    # Probe the first rows so that wrong encoding/delimiter
+                    # combinations are rejected without parsing the whole file
+                    probe = pd.read_csv(
+                        file_path, encoding=encoding, delimiter=delimiter, nrows=1000
                     )
-                    df = pd.concat(chunk_iter, ignore_index=True)
+                    if probe.empty or len(probe.columns) <= 1:
+                        continue
+                    # Columns that hold text in the probe hold text in the whole file,
+                    # so declare their dtype instead of letting every chunk attempt
+                    # numeric conversion first. Numeric columns are still inferred,
+                    # since later rows may introduce missing values.
+                    numeric_columns = probe.select_dtypes(
+                        include=['number', 'bool']).columns
+                    dtypes = {col: probe[col].dtype for col in probe.columns
+                              if col not in numeric_columns}
+                    chunks = []
+                    with open(file_path, 'rb') as handle:
+                        file_size = max(os.fstat(handle.fileno()).st_size, 1)
+                        chunk_iter = pd.read_csv(
+                            handle, encoding=encoding, delimiter=delimiter, chunksize=100000,
+                            dtype=dtypes
+                        )
+                        self.progress.emit(0)
+                        for chunk in chunk_iter:
+                            chunks.append(chunk)
+                            self.progress.emit(
+                                min(int(handle.tell() * 100 / file_size), 100))
+                    df = pd.concat(chunks, ignore_index=True)
                     if not df.empty and len(df.columns) > 1:
                         return df
                 except Exception:
@@ -346,9 +446,13 @@ class PreprocessingWorker(QtCore.QObject):
         Execute the data preprocessing process and emit appropriate signals.
 
         This method runs in a separate thread to prevent blocking the UI.
-        It uses the `preprocess_data` utility function to preprocess the data.
+        It uses the `preprocess_data` utility function to preprocess the data. The
+        function is imported here, so that scikit-learn and SciPy are only loaded once
+        preprocessing is first requested, not at application start-up.
         """
         try:
+            from utils.preprocessing import preprocess_data
+
             # Preprocess the data using the provided utility function
             data_preprocessed, preprocessing_method_description = preprocess_data(
                 self.data, self.numerical_columns, self.categorical_columns
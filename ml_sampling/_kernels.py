@@ -0,0 +1,51 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _distances_to_own_centers(X, centers, labels, out):
+        n_samples, n_features = X.shape
+        for i in prange(n_samples):
+            center = labels[i]
+            total = 0.0
+            for j in range(n_features):
+                diff = X[i, j] - centers[center, j]
+                total += diff * diff
+            out[i] = np.sqrt(total)
+
+
+def distances_to_own_centers(X: np.ndarray, centers: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Computes the Euclidean distance of every point to the center of its own cluster.
+
+    Uses a parallel Numba kernel when numba is installed, which avoids allocating the
+    (n_samples, n_features) array of differences, and NumPy otherwise.
+
+    Parameters:
+    -----------
+    X : np.ndarray
+        Data matrix of shape (n_samples, n_features).
+    centers : np.ndarray
+        Cluster centers of shape (n_clusters, n_features).
+    labels : np.ndarray
+        Index of the center of each point.
+
+    Returns:
+    --------
+    np.ndarray
+        Distances of shape (n_samples,), in the dtype of X.
+    """
+    if njit is not None:
+        X = np.ascontiguousarray(X)
+        centers = np.ascontiguousarray(centers, dtype=X.dtype)
+        out = np.empty(len(X), dtype=X.dtype)
+        _distances_to_own_centers(X, centers, np.ascontiguousarray(labels), out)
+        return out
+
+    diff = X - centers[labels]
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
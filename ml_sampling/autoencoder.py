@@ -155,14 +155,14 @@ def autoencoder_sampling(data: pd.DataFrame, data_preprocessed: pd.DataFrame, sa
         population_for_chart['anomaly_score'] = anomaly_scores
 
         # Sort data by anomaly score and select top "sample_size" records as the sample
-        sample_indices = np.argsort(anomaly_scores)[-sample_size:]
-        population_with_results['is_sample'] = 0
-        population_with_results.loc[sample_indices, 'is_sample'] = 1
-
-        population_for_chart['is_sample'] = 0
-        population_for_chart.loc[sample_indices, 'is_sample'] = 1
-
-        sample = population_with_results[population_with_results['is_sample'] == 1]
+        # argsort yields row positions, so mark them positionally rather than by label
+        sample_positions = np.argsort(anomaly_scores)[-sample_size:]
+        is_sample = np.zeros(len(anomaly_scores), dtype=np.int8)
+        is_sample[sample_positions] = 1
+        population_with_results['is_sample'] = is_sample
+        population_for_chart['is_sample'] = is_sample
+
+        sample = population_with_results[is_sample == 1]
 
         # Total population size and number of records processed
         total_population_size = len(data)
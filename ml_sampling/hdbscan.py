@@ -1,17 +1,28 @@
 import pandas as pd
 import optuna
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import numpy as np
 import logging
 from sklearn.cluster import HDBSCAN
 import datetime
-from scoring_methods.silhouette import calculate_silhouette
+from scoring_methods.silhouette import (
+    calculate_silhouette, calculate_silhouette_precomputed, subsample_distance_matrices)
+from ml_sampling.tuning import create_study, optimize_study
+
+try:
+    import hdbscan as hdbscan_lib
+except ImportError:
+    hdbscan_lib = None
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Number of features from which tuning trials are run on precomputed distance matrices.
+# Below it, HDBSCAN's KD-tree is faster than a brute-force pass over a distance matrix.
+PRECOMPUTE_MIN_FEATURES = 20
+
 
 def hdbscan_sampling(
     population_original: pd.DataFrame,
@@ -19,28 +30,58 @@ def hdbscan_sampling(
     sample_size: int,
     features: List[str],
     random_seed: int,
-    progress_callback=None  # Added progress_callback parameter
+    progress_callback=None,  # Added progress_callback parameter
+    warm_start_trials: Optional[List[optuna.trial.FrozenTrial]] = None,
+    n_jobs: int = 1,
+    storage: Optional[str] = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, str, optuna.Study]:
     """
     Anomaly sampling using the HDBSCAN clustering algorithm with hyperparameter tuning via Optuna.
+
+    Trials passed in `warm_start_trials` (from an earlier study on the same data, run with the
+    same `random_seed`) are added to the new study and the full trial budget is run on top of them.
+
+    Trials run concurrently when `n_jobs` > 1: in threads, or in `n_jobs` separate processes
+    sharing the study when an Optuna RDB `storage` URL is given. Results are only reproducible
+    with `n_jobs` = 1. Trials whose running silhouette score falls below the median of earlier
+    trials at the same subsample are pruned.
+
+    When the optional `hdbscan` package is installed, data with fewer than
+    PRECOMPUTE_MIN_FEATURES features is clustered with its multi-core Boruvka implementation,
+    both in the trials and in the final model, so that the tuned parameters select the
+    anomalies with the model they were scored on.
     """
 
     try:
-        # Make copies to avoid modifying the original DataFrames
-        population_original = population_original.copy()
-        population = population.copy()
+        # The input DataFrames are not modified; the annotated copies are built
+        # with a single assign once all columns are known
+
+        # Convert the features once to the contiguous float32 array all fits run on
+        X = np.ascontiguousarray(population.to_numpy(dtype=np.float32))
 
         # Initialize random number generator for reproducibility
         rng = np.random.default_rng(random_seed)
 
-        def choose_algorithm(n_samples: int, n_features: int) -> str:
-            if n_features < 20 and n_samples < 10000:
-                return 'kdtree'
-            else:
-                return 'balltree'
-
-        chosen_algorithm = choose_algorithm(
-            population.shape[0], population.shape[1])
+        # Every trial is scored on the same seeded subsamples. For wide data, where
+        # neighbour trees lose their advantage, compute the distance matrices of the
+        # subsamples once instead of rebuilding a tree in every trial
+        distance_matrices = None
+        if X.shape[1] >= PRECOMPUTE_MIN_FEATURES:
+            distance_matrices = subsample_distance_matrices(X, random_seed)
+        # The hdbscan package labels noise differently from scikit-learn, so the
+        # implementation chosen here is used for the trials and the final model alike
+        use_hdbscan_lib = hdbscan_lib is not None and distance_matrices is None
+
+        def make_clusterer(params, metric='euclidean'):
+            params = dict(params, cluster_selection_method='eom',
+                          allow_single_cluster=True)
+            if use_hdbscan_lib:
+                # The hdbscan package computes core distances on all cores and
+                # builds an approximate minimum spanning tree with Boruvka's algorithm
+                return hdbscan_lib.HDBSCAN(
+                    metric=metric, algorithm='boruvka_kdtree',
+                    approx_min_span_tree=True, core_dist_n_jobs=-1, **params)
+            return HDBSCAN(metric=metric, **params)
 
         # Define the Optuna objective function for hyperparameter tuning
         def objective(trial):
@@ -48,14 +89,27 @@ def hdbscan_sampling(
                 'min_cluster_size': trial.suggest_int('min_cluster_size', 2, 20),
                 'min_samples': trial.suggest_int('min_samples', 1, 20),
                 'cluster_selection_epsilon': trial.suggest_float('cluster_selection_epsilon', 0.0, 1.0),
-                'alpha': trial.suggest_float('alpha', 0.0, 2.0),
-                'metric': 'euclidean',
-                'algorithm': chosen_algorithm,
-                'cluster_selection_method': 'eom',
-                'allow_single_cluster': True
+                'alpha': trial.suggest_float('alpha', 0.0, 2.0)
             }
-            clusterer = HDBSCAN(**params)
-            return calculate_silhouette(clusterer, population)
+            if distance_matrices is not None:
+                clusterer = make_clusterer(params, metric='precomputed')
+            else:
+                clusterer = make_clusterer(params)
+
+            # Report the running score after each silhouette subsample, so that
+            # trials scoring below the median of earlier trials stop early. Subsamples
+            # with fewer than two clusters score -inf, which is reported as silhouette's
+            # lower bound: the pruner's median of infinite values would be NaN
+            def report_score(step, score):
+                trial.report(max(score, -1.0), step)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+
+            if distance_matrices is None:
+                return calculate_silhouette(clusterer, X, random_seed=random_seed,
+                                            report_callback=report_score)
+            return calculate_silhouette_precomputed(clusterer, distance_matrices,
+                                                    report_callback=report_score)
 
         # Total number of trials for progress calculation
         n_trials = 100
@@ -63,53 +117,58 @@ def hdbscan_sampling(
         # Define Optuna callback to report progress
         def optuna_callback(study, trial):
             if progress_callback is not None:
-                progress = int((len(study.trials) / n_trials) * 100)
+                progress = int(
+                    ((len(study.trials) - n_reused_trials) / n_trials) * 100)
                 progress_callback(progress)
 
         # Run Optuna optimization with random seed for reproducibility
-        study = optuna.create_study(
-            direction='maximize', sampler=optuna.samplers.TPESampler(seed=random_seed))
-        study.optimize(objective, n_trials=n_trials,
+        study = create_study(random_seed, n_trials=n_trials, storage=storage,
+                             warm_start_trials=warm_start_trials,
+                             pruner=optuna.pruners.MedianPruner(
+                                 n_startup_trials=10, n_warmup_steps=0))
+        n_reused_trials = len(study.trials)
+        optimize_study(study, objective, n_trials,
+                       n_jobs=n_jobs, storage=storage, random_seed=random_seed,
                        callbacks=[optuna_callback])
+        # The subsample distance matrices are only needed by the trials
+        distance_matrices = None
 
         best_params = study.best_params
-        best_clusterer = HDBSCAN(**best_params)
-        labels = best_clusterer.fit_predict(population)
+        labels = make_clusterer(best_params).fit_predict(X)
+        num_clusters = labels.max() + 1
 
-        # Annotate clusters and anomalies
-        population_original['cluster'] = labels
-        population_original['is_anomaly'] = (labels == -1).astype(int)
-        population_original['is_sample'] = 0
-        population['cluster'] = labels
-        population['is_anomaly'] = (labels == -1).astype(int)
-        population['is_sample'] = 0
-        num_clusters = max(population_original['cluster']) + 1
-
-        # Identify anomalies
-        anomalies = population_original[population_original['is_anomaly'] == 1]
+        # Identify anomalies by row position
+        anomaly_mask = labels == -1
+        anomaly_positions = np.flatnonzero(anomaly_mask)
+        total_anomalies = len(anomaly_positions)
 
         # Check if there are any anomalies
-        if anomalies.empty:
+        if total_anomalies == 0:
             raise ValueError("У наборі даних не було виявлено аномалій.")
 
         # Sample anomalies based on the requested sample size
-        if len(anomalies) > sample_size:
-            sample_indices = rng.choice(
-                anomalies.index, size=sample_size, replace=False)
-            sample_processed = anomalies.loc[sample_indices]
+        if total_anomalies > sample_size:
+            # The order of the drawn rows is irrelevant, so skip shuffling them
+            sample_positions = rng.choice(
+                anomaly_positions, size=sample_size, replace=False, shuffle=False)
             warning_message = ""
         else:
-            sample_processed = anomalies
-            warning_message = f"Warning: Only {len(anomalies)} anomalies found, less than the requested sample size of {sample_size}."
-
-        # Mark the sampled data
-        population_original.loc[sample_processed.index, 'is_sample'] = 1
-        population.loc[sample_processed.index, 'is_sample'] = 1
-        sample_processed = sample_processed.copy()
-        sample_processed['is_sample'] = 1
-
-        # Total population size and the number of anomalies detected
-        total_anomalies = len(anomalies)
+            sample_positions = anomaly_positions
+            warning_message = f"Warning: Only {total_anomalies} anomalies found, less than the requested sample size of {sample_size}."
+
+        # Annotate clusters, anomalies and the sampled data, using the smallest
+        # integer types that hold them
+        is_anomaly = anomaly_mask.astype(np.int8)
+        labels = pd.to_numeric(labels, downcast='integer')
+        is_sample = np.zeros(len(labels), dtype=np.int8)
+        is_sample[sample_positions] = 1
+        population_original = population_original.assign(
+            cluster=labels, is_anomaly=is_anomaly, is_sample=is_sample)
+        population = population.assign(
+            cluster=labels, is_anomaly=is_anomaly, is_sample=is_sample)
+        sample_processed = population_original.iloc[sample_positions].copy()
+
+        # Total population size
         population_size = len(population_original)
 
         method_description = (
@@ -124,6 +183,7 @@ def hdbscan_sampling(
             f"Sample creation date and time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}.\n"
             f"Random seed: {random_seed}.\n"
             f"Number of trials: {len(study.trials)}.\n"
+            f"Trials reused from an earlier run with the same random seed: {n_reused_trials}.\n"
         )
 
         # Report completion progress
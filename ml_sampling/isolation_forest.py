@@ -3,6 +3,7 @@ from sklearn.ensemble import IsolationForest
 from typing import List, Tuple
 import logging
 import datetime
+import numpy as np
 
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -62,17 +63,21 @@ def isolation_forest_sampling(
         # Add anomaly scores and labels to both DataFrames
         population_original['anomaly_score'] = population['anomaly_score'] = anomaly_scores
         population_original['is_anomaly'] = population['is_anomaly'] = anomaly_predictions
-        population_original['is_sample'] = population['is_sample'] = 0
 
         # Sort the DataFrames based on anomaly scores
-        population_original = population_original.sort_values(
-            by='anomaly_score', ascending=True)
-        population = population.sort_values(by='anomaly_score', ascending=True)
+        order = np.argsort(anomaly_scores, kind='stable')
+        population_original = population_original.iloc[order]
+        population = population.iloc[order]
+
+        # Mark the sampled data: after sorting, the most anomalous samples are the
+        # first `sample_size` rows
+        is_sample = np.zeros(len(order), dtype=np.int8)
+        is_sample[:sample_size] = 1
+        population_original = population_original.assign(is_sample=is_sample)
+        population = population.assign(is_sample=is_sample)
 
         # Select the most anomalous samples
         sample_processed = population_original.head(sample_size)
-        population_original.loc[sample_processed.index, 'is_sample'] = 1
-        population.loc[sample_processed.index, 'is_sample'] = 1
 
         # Get the total number of anomalies detected (where 'is_anomaly' == 1)
         total_anomalies = population_original['is_anomaly'].sum()
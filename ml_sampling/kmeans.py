@@ -1,13 +1,13 @@
 import pandas as pd
-from sklearn.cluster import KMeans
-from sklearn.metrics import pairwise_distances_argmin_min
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import optuna
-from sklearn.metrics import calinski_harabasz_score
-from typing import Tuple, List
+from scoring_methods.calinski_harabasz import calinski_harabasz, total_sum_of_squares
+from typing import Tuple, List, Optional
 import logging
 import datetime
 import numpy as np
-import heapq
+from ml_sampling.tuning import create_study, optimize_study
+from ml_sampling._kernels import distances_to_own_centers
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,10 +21,15 @@ def kmeans_sampling(
     features: List[str],
     random_seed: int,
     progress_callback=None,
-    anomalies_per_cluster: int = None  # Новый параметр
+    anomalies_per_cluster: int = None,  # Новый параметр
+    warm_start_trials: Optional[List[optuna.trial.FrozenTrial]] = None,
+    n_jobs: int = 1,
+    storage: Optional[str] = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, str, optuna.Study]:
     """
     Performs sampling using K-Means clustering with Optuna-based hyperparameter optimization.
+    Optuna trials are scored with MiniBatchKMeans; the final model is a full K-Means fit
+    with the best parameters.
     The clustering quality is evaluated using dynamically selected metrics. 
     The selection of samples is based on relative distances to centroids within each cluster.
     Anomalies are selected uniformly from each cluster based on their relative distance.
@@ -37,6 +42,11 @@ def kmeans_sampling(
     - random_seed: Seed for reproducibility.
     - progress_callback: Optional callback for reporting progress.
     - anomalies_per_cluster: Number of anomalies to select per cluster. If None, sample_size is distributed proportionally.
+    - warm_start_trials: Trials of an earlier study on the same data, run with the same random_seed.
+      They are added to the new study and the full trial budget is run on top of them.
+    - n_jobs: Number of Optuna trials to run concurrently. Results are only reproducible with 1.
+    - storage: Optional Optuna RDB storage URL. With n_jobs > 1 the trials are then run in
+      n_jobs separate processes sharing the study through the storage.
 
     Returns:
     - population_original: Original DataFrame with 'distance_to_centroid', 'cluster', and 'is_sample' columns.
@@ -46,27 +56,40 @@ def kmeans_sampling(
     - study: Optuna study object.
     """
     try:
-        # Make copies to avoid modifying the original DataFrames
-        population_original = population_original.copy()
-        population = population.copy()
+        # The input DataFrames are not modified; the annotated copies are built
+        # with a single assign once all columns are known
+
+        # Convert the features once to the contiguous float32 array all fits run on
+        X = np.ascontiguousarray(population.to_numpy(dtype=np.float32))
+        # The total sum of squares does not depend on the clustering, so every
+        # trial's Calinski-Harabasz score reuses it
+        total_ss = total_sum_of_squares(X)
 
         def objective(trial):
             params = {
                 'n_clusters': trial.suggest_int('n_clusters', 2, 20),
                 'init': 'k-means++',
-                'n_init': trial.suggest_int('n_init', 5, 30),
+                # k-means++ seeding rarely improves after a few restarts
+                'n_init': trial.suggest_int('n_init', 1, 5),
                 'max_iter': trial.suggest_int('max_iter', 100, 500)
             }
 
-            # Fit KMeans with the current parameters
-            kmeans = KMeans(random_state=random_seed, **params)
-            kmeans.fit(population)
+            # Score the parameters with MiniBatchKMeans, which only needs a good
+            # estimate; the full KMeans is fitted once with the best parameters
+            kmeans = MiniBatchKMeans(
+                random_state=random_seed,
+                n_clusters=params['n_clusters'],
+                init=params['init'],
+                n_init=params['n_init'],
+                max_iter=params['max_iter'],
+                batch_size=min(4096, len(X)))
+            kmeans.fit(X)
 
             # Get cluster labels
             labels = kmeans.labels_
 
             # Calculate Calinski-Harabasz score for the current clustering
-            score = calinski_harabasz_score(population, labels)
+            score = calinski_harabasz(X, labels, total_ss)
 
             return score
 
@@ -74,39 +97,42 @@ def kmeans_sampling(
 
         def optuna_callback(study, trial):
             if progress_callback is not None:
-                progress = int((len(study.trials) / n_trials) * 100)
+                progress = int(
+                    ((len(study.trials) - n_reused_trials) / n_trials) * 100)
                 progress_callback(progress)
 
-        study = optuna.create_study(
-            direction='maximize', sampler=optuna.samplers.TPESampler(seed=random_seed))
-        study.optimize(objective, n_trials=n_trials,
+        study = create_study(random_seed, n_trials=n_trials, storage=storage,
+                             warm_start_trials=warm_start_trials)
+        n_reused_trials = len(study.trials)
+        optimize_study(study, objective, n_trials,
+                       n_jobs=n_jobs, storage=storage, random_seed=random_seed,
                        callbacks=[optuna_callback])
 
         best_params = study.best_params
         best_kmeans = KMeans(random_state=random_seed, **best_params)
-        best_kmeans.fit(population)
-
-        clusters = best_kmeans.predict(population)
-        _, distances = pairwise_distances_argmin_min(
-            population, best_kmeans.cluster_centers_)
-
-        population_original['distance_to_centroid'] = distances
-        population_original['cluster'] = clusters
-        population['distance_to_centroid'] = distances
-        population['cluster'] = clusters
-
-        # Calculate relative distances within each cluster
-        population['relative_distance'] = 0.0
-        for cluster in np.unique(clusters):
-            cluster_distances = population.loc[population['cluster']
-                                               == cluster, 'distance_to_centroid']
-            std_dev = cluster_distances.std()
-            if std_dev > 0:
-                population.loc[population['cluster'] == cluster,
-                               'relative_distance'] = cluster_distances / std_dev
-            else:
-                population.loc[population['cluster'] ==
-                               cluster, 'relative_distance'] = 0.0
+        best_kmeans.fit(X)
+
+        # Each point's nearest centroid is its assigned one, so the distance is only
+        # needed to that centroid, not to all of them
+        clusters = best_kmeans.labels_
+        distances = distances_to_own_centers(
+            X, best_kmeans.cluster_centers_, clusters)
+
+        # Calculate relative distances within each cluster: the distance divided by
+        # the (sample) standard deviation of the distances in the point's cluster
+        n_points = len(distances)
+        cluster_sizes = np.bincount(clusters)
+        cluster_sums = np.bincount(clusters, weights=distances)
+        cluster_means = cluster_sums / np.maximum(cluster_sizes, 1)
+        cluster_ss = np.bincount(
+            clusters, weights=(distances - cluster_means[clusters]) ** 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cluster_std = np.sqrt(cluster_ss / (cluster_sizes - 1))
+        point_std = cluster_std[clusters]
+        relative_distances = np.zeros(n_points)
+        has_spread = point_std > 0
+        relative_distances[has_spread] = distances[has_spread] / \
+            point_std[has_spread]
 
         # Determine anomalies per cluster
         unique_clusters = np.unique(clusters)
@@ -123,37 +149,41 @@ def kmeans_sampling(
             if anomalies_per_cluster == 0:
                 anomalies_per_cluster = 1  # At least one per cluster
 
-        selected_indices = []
+        # Selection works on row positions; rows are only looked up by label at the end
+        selected_positions = []
         for cluster in unique_clusters:
-            cluster_data = population.loc[population['cluster'] == cluster]
-            # Sort by relative_distance descending
-            sorted_cluster = cluster_data.sort_values(
-                by='relative_distance', ascending=False)
-            # Select top anomalies_per_cluster indices
-            top_indices = sorted_cluster.head(
-                anomalies_per_cluster).index.tolist()
-            selected_indices.extend(top_indices)
+            members = np.flatnonzero(clusters == cluster)
+            # Select the anomalies_per_cluster members with the largest relative_distance
+            order = np.argsort(-relative_distances[members], kind='stable')
+            selected_positions.extend(
+                members[order[:anomalies_per_cluster]].tolist())
 
         # If sample_size is not perfectly divisible, fill the remaining
-        remaining = sample_size - len(selected_indices)
+        remaining = sample_size - len(selected_positions)
         if remaining > 0:
-            # Select remaining points from all clusters based on relative_distance
-            remaining_indices = heapq.nlargest(
-                remaining,
-                population.index,
-                population['relative_distance'].take)
-            selected_indices.extend(remaining_indices)
+            # Select remaining points from all clusters based on relative_distance,
+            # skipping the points that were already selected
+            candidate_distances = relative_distances.copy()
+            candidate_distances[selected_positions] = -np.inf
+            remaining = min(remaining, n_points - len(selected_positions))
+            if remaining > 0:
+                remaining_positions = np.argpartition(
+                    candidate_distances, -remaining)[-remaining:]
+                selected_positions.extend(remaining_positions.tolist())
 
         # Ensure we don't exceed the population size
-        selected_indices = selected_indices[:sample_size]
-
-        sample_processed = population_original.loc[selected_indices].copy()
-
-        population_original['is_sample'] = 0
-        population['is_sample'] = 0
-        population_original.loc[selected_indices, 'is_sample'] = 1
-        population.loc[selected_indices, 'is_sample'] = 1
-        sample_processed['is_sample'] = 1
+        selected_positions = selected_positions[:sample_size]
+
+        is_sample = np.zeros(n_points, dtype=np.int8)
+        is_sample[selected_positions] = 1
+        # At most 20 clusters, so the labels fit the smallest integer type
+        clusters = pd.to_numeric(clusters, downcast='integer')
+        population_original = population_original.assign(
+            distance_to_centroid=distances, cluster=clusters, is_sample=is_sample)
+        population = population.assign(
+            distance_to_centroid=distances, cluster=clusters,
+            relative_distance=relative_distances, is_sample=is_sample)
+        sample_processed = population_original.iloc[selected_positions].copy()
 
         population_size = len(population_original)
         best_num_clusters = best_params['n_clusters']
@@ -168,6 +198,7 @@ def kmeans_sampling(
             f"Creation date and time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}.\n"
             f"Random seed: {random_seed}.\n"
             f"Number of trials: {len(study.trials)}.\n"
+            f"Trials reused from an earlier run with the same random seed: {n_reused_trials}.\n"
         )
 
         if progress_callback is not None:
@@ -65,21 +65,21 @@ def lof_sampling(
         population_original['anomaly_score'] = population['anomaly_score'] = anomaly_scores
         population_original['is_anomaly'] = population['is_anomaly'] = (
             anomaly_predictions == -1).astype(int)
-        population_original['is_sample'] = population['is_sample'] = 0
 
         # Sort the DataFrames based on anomaly scores (highest scores first, as they indicate more abnormal)
-        population_original = population_original.sort_values(
-            by='anomaly_score', ascending=True)
-        population = population.sort_values(
-            by='anomaly_score', ascending=True)
+        order = np.argsort(anomaly_scores, kind='stable')
+        population_original = population_original.iloc[order]
+        population = population.iloc[order]
+
+        # Mark the sampled data: after sorting, the sample is the first `sample_size` rows
+        is_sample = np.zeros(len(order), dtype=np.int8)
+        is_sample[:sample_size] = 1
+        population_original = population_original.assign(is_sample=is_sample)
+        population = population.assign(is_sample=is_sample)
 
         # Select top `sample_size` most anomalous samples based on the score
         sample_processed = population_original.head(sample_size)
 
-        # Mark the sampled data
-        population_original.loc[sample_processed.index, 'is_sample'] = 1
-        population.loc[sample_processed.index, 'is_sample'] = 1
-
         # Total population size and number of anomalies
         population_size = len(population_original)
         total_anomalies = (population_original['is_anomaly'] == 1).sum()
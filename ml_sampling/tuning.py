@@ -0,0 +1,192 @@
+import os
+import numpy as np
+import optuna
+import warnings
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
+from typing import Callable, List, Optional
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def create_sampler(random_seed: Optional[int], n_trials: int) -> optuna.samplers.TPESampler:
+    """
+    Creates the TPE sampler of the tuning studies.
+
+    The sampler uses the constant liar strategy, so that concurrently running trials do
+    not suggest the same parameters, and a longer random startup phase than Optuna's
+    default of 10 trials. The parameters are modelled independently (multivariate=False
+    is explicit, as recent Optuna versions default to the multivariate variant): the
+    multivariate variant stops exploring when the first trials all score -inf, which the
+    silhouette objective returns for parameters that find fewer than two clusters.
+
+    Parameters:
+    -----------
+    random_seed : Optional[int]
+        Seed of the sampler.
+    n_trials : int
+        Trial budget of the study; a fifth of it (at most 20) are random startup trials.
+
+    Returns:
+    --------
+    optuna.samplers.TPESampler
+        The configured sampler.
+    """
+    with warnings.catch_warnings():
+        # constant_liar is flagged as experimental
+        warnings.simplefilter('ignore', optuna.exceptions.ExperimentalWarning)
+        return optuna.samplers.TPESampler(
+            seed=random_seed, multivariate=False, constant_liar=True,
+            n_startup_trials=max(min(20, n_trials // 5), 1))
+
+
+def create_study(
+        random_seed: int,
+        n_trials: int = 100,
+        storage: Optional[str] = None,
+        study_name: Optional[str] = None,
+        warm_start_trials: Optional[List[optuna.trial.FrozenTrial]] = None,
+        pruner: Optional[optuna.pruners.BasePruner] = None) -> optuna.Study:
+    """
+    Creates the maximizing Optuna study used to tune the clustering samplers.
+
+    Parameters:
+    -----------
+    random_seed : int
+        Seed of the TPE sampler.
+    n_trials : int, optional
+        Trial budget of the study, used to size the sampler's startup phase
+        (default is 100).
+    storage : Optional[str], optional
+        Optuna RDB storage URL (e.g. 'sqlite:///tuning.db'). If None, the study is kept
+        in memory (default is None).
+    study_name : Optional[str], optional
+        Name of the study in the storage. An existing study of that name is resumed
+        (default is None, which generates a new name).
+    warm_start_trials : Optional[List[optuna.trial.FrozenTrial]], optional
+        Trials of an earlier study on the same data and with the same seed, added when the
+        study is empty (default is None).
+    pruner : Optional[optuna.pruners.BasePruner], optional
+        Pruner stopping unpromising trials from their reported intermediate values
+        (default is None, which uses Optuna's MedianPruner).
+
+    Returns:
+    --------
+    optuna.Study
+        The created or resumed study. Its `random_seed` user attribute holds the seed, so
+        that a later study continuing it can be run with the same seed.
+    """
+    # Optuna logs every finished trial at INFO level; only keep warnings
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    sampler = create_sampler(random_seed, n_trials)
+    if storage is None:
+        storage = optuna.storages.InMemoryStorage()
+    study = optuna.create_study(
+        direction='maximize', sampler=sampler, pruner=pruner, storage=storage,
+        study_name=study_name, load_if_exists=study_name is not None)
+    study.set_user_attr('random_seed', random_seed)
+    if warm_start_trials and not study.trials:
+        study.add_trials(warm_start_trials)
+    return study
+
+
+def _optimize_worker(
+        study_name: str,
+        storage: str,
+        objective: Callable,
+        n_trials: int,
+        sampler: optuna.samplers.BaseSampler,
+        pruner: Optional[optuna.pruners.BasePruner],
+        blas_threads: int) -> None:
+    """
+    Runs a share of the trials of a study stored in an RDB storage.
+
+    Executed in a separate process, which loads the study by name with its own sampler
+    and the pruner of the parent study, and uses at most `blas_threads` BLAS threads.
+    """
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name, storage=storage, sampler=sampler, pruner=pruner)
+    with threadpool_limits(limits=blas_threads, user_api='blas'):
+        study.optimize(objective, n_trials=n_trials, gc_after_trial=False)
+
+
+def optimize_study(
+        study: optuna.Study,
+        objective: Callable,
+        n_trials: int,
+        n_jobs: int = 1,
+        storage: Optional[str] = None,
+        random_seed: Optional[int] = None,
+        callbacks: Optional[List[Callable]] = None) -> None:
+    """
+    Runs the trials of a study serially, in threads or in separate processes.
+
+    Parameters:
+    -----------
+    study : optuna.Study
+        Study created with `create_study`.
+    objective : Callable
+        Objective function of the study.
+    n_trials : int
+        Number of trials to run.
+    n_jobs : int, optional
+        Number of concurrent workers (default is 1).
+    storage : Optional[str], optional
+        RDB storage URL the study was created with. When given together with n_jobs > 1,
+        the trials are split across `n_jobs` loky processes that share the study through
+        the storage; otherwise concurrent trials run in threads of this process
+        (default is None).
+    random_seed : Optional[int], optional
+        Base seed of the samplers of the worker processes, from which a distinct 32-bit
+        seed per worker is derived (default is None).
+    callbacks : Optional[List[Callable]], optional
+        Callbacks invoked after each trial. With worker processes they are invoked once,
+        after all trials have finished (default is None).
+
+    Notes:
+    ------
+    Results are reproducible only with n_jobs=1: with concurrent trials the order in
+    which trials complete, and therefore the suggested parameters, varies between runs.
+    """
+    if n_trials <= 0:
+        return
+    n_jobs = max(min(n_jobs, n_trials), 1)
+    # Give each concurrent trial an equal share of the cores for BLAS, so that
+    # n_jobs trials do not each start a thread per core
+    blas_threads = max((os.cpu_count() or 1) // n_jobs, 1)
+
+    if storage is None or n_jobs == 1:
+        with threadpool_limits(limits=blas_threads, user_api='blas'):
+            study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs,
+                           callbacks=callbacks, gc_after_trial=False)
+        return
+
+    # Spread the trials as evenly as possible across the worker processes. Each
+    # worker gets its own sampler, sized for the whole budget of the shared study
+    budget = len(study.trials) + n_trials
+    shares = [n_trials // n_jobs + (1 if i < n_trials % n_jobs else 0)
+              for i in range(n_jobs)]
+    # Derive the worker seeds with SeedSequence, which keeps them within the 32-bit
+    # range TPESampler accepts for any base seed
+    if random_seed is None:
+        worker_seeds = [None] * n_jobs
+    else:
+        worker_seeds = [int(seed.generate_state(1)[0])
+                        for seed in np.random.SeedSequence(random_seed).spawn(n_jobs)]
+    logger.info(
+        f"Running {n_trials} trials of study '{study.study_name}' in {n_jobs} processes.")
+    Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_optimize_worker)(
+            study.study_name, storage, objective, share,
+            create_sampler(worker_seed, budget), study.pruner, blas_threads)
+        for worker_seed, share in zip(worker_seeds, shares))
+
+    # Let the callbacks see the finished study, e.g. to report progress
+    study_trials = study.trials
+    for callback in callbacks or []:
+        callback(study, study_trials[-1])
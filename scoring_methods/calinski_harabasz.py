@@ -0,0 +1,82 @@
+import numpy as np
+from scipy import sparse
+from typing import Optional
+
+
+def total_sum_of_squares(data: np.ndarray) -> float:
+    """
+    Computes the total sum of squared distances of the data points to their mean.
+
+    Parameters:
+    -----------
+    data : np.ndarray
+        Data matrix of shape (n_samples, n_features).
+
+    Returns:
+    --------
+    float
+        Total sum of squares, accumulated in float64.
+    """
+    centered = data - data.mean(axis=0, dtype=np.float64)
+    return float(np.einsum('ij,ij->', centered, centered))
+
+
+def calinski_harabasz(data: np.ndarray, labels: np.ndarray,
+                      total_ss: Optional[float] = None) -> float:
+    """
+    Computes the Calinski-Harabasz score of a clustering, equal to
+    sklearn.metrics.calinski_harabasz_score.
+
+    The between-cluster dispersion is computed from the cluster means, which are summed
+    in a single sparse product over the data, and the within-cluster dispersion follows
+    from the total sum of squares. Passing the total sum of squares, which does not
+    depend on the labels, avoids recomputing it when many clusterings of the same data
+    are scored.
+
+    Parameters:
+    -----------
+    data : np.ndarray
+        Data matrix of shape (n_samples, n_features).
+    labels : np.ndarray
+        Non-negative cluster label of each sample.
+    total_ss : Optional[float], optional
+        Total sum of squares of the data, as returned by total_sum_of_squares
+        (default is None, which computes it).
+
+    Returns:
+    --------
+    float
+        The Calinski-Harabasz score.
+
+    Raises:
+    -------
+    ValueError:
+        If the number of distinct labels is not between 2 and n_samples - 1.
+    """
+    n_samples = data.shape[0]
+    _, labels = np.unique(labels, return_inverse=True)
+    labels = labels.ravel()
+    n_labels = labels.max() + 1 if n_samples else 0
+    if not 1 < n_labels < n_samples:
+        raise ValueError(
+            f"Number of labels is {n_labels}. Valid values are 2 to n_samples - 1 (inclusive)")
+
+    if total_ss is None:
+        total_ss = total_sum_of_squares(data)
+
+    # Sum the points of every cluster with one sparse (n_labels x n_samples) product
+    membership = sparse.csr_matrix(
+        (np.ones(n_samples), (labels, np.arange(n_samples))),
+        shape=(n_labels, n_samples))
+    cluster_sizes = np.bincount(labels, minlength=n_labels)
+    cluster_sums = np.asarray(membership @ data, dtype=np.float64)
+    overall_mean = cluster_sums.sum(axis=0) / n_samples
+    cluster_offsets = cluster_sums / cluster_sizes[:, None] - overall_mean
+
+    between = float(np.einsum('k,kj,kj->', cluster_sizes,
+                    cluster_offsets, cluster_offsets))
+    within = total_ss - between
+
+    if within <= 0.0:
+        return 1.0
+    return between * (n_samples - n_labels) / (within * (n_labels - 1.0))
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
-from sklearn.metrics import silhouette_score
-from typing import List
+from sklearn.metrics import pairwise_distances_chunked, silhouette_score
+from typing import Callable, List, Optional, Union
 import logging
 
 # Configure logging
@@ -23,6 +23,13 @@ def define_sample_sizes(n_samples: int) -> List[int]:
     --------
     List[int]
         List of sample sizes to use for subsampling.
+
+    Notes:
+    ------
+    Subsamples are capped at 5000 rows. Scoring a subsample of s rows takes O(s²) distance
+    evaluations, which silhouette_score computes in chunks rather than as one materialised
+    matrix, so the cap bounds each call to about 25 million distances however large the
+    dataset is.
     """
     if n_samples < 1000:
         return [n_samples]
@@ -36,7 +43,42 @@ def define_sample_sizes(n_samples: int) -> List[int]:
         return [5000] * 3
 
 
-def compute_silhouette_scores(clusterer, data: pd.DataFrame, sample_sizes: List[int], random_seed: int = None) -> float:
+def score_subsample(clusterer, sample, metric: str = 'euclidean') -> float:
+    """
+    Fits the clusterer on one subsample and computes its silhouette score.
+
+    Parameters:
+    -----------
+    clusterer : object
+        Clustering or anomaly detection object that implements fit_predict or predict method.
+    sample : pd.DataFrame or np.ndarray
+        Subsample of the data, or its pairwise distance matrix when metric is 'precomputed'.
+    metric : str, optional
+        Metric passed to silhouette_score (default is 'euclidean').
+
+    Returns:
+    --------
+    float
+        Silhouette score of the subsample, or -inf if fewer than two clusters were found.
+    """
+    # Check if clusterer has fit_predict or predict
+    if hasattr(clusterer, 'fit_predict'):
+        labels = clusterer.fit_predict(sample)
+    elif hasattr(clusterer, 'predict'):
+        labels = clusterer.predict(sample)
+    else:
+        raise ValueError(
+            f"Clusterer does not support 'fit_predict' or 'predict': {type(clusterer)}")
+
+    unique_labels = set(labels)
+    unique_labels.discard(-1)  # For HDBSCAN or outlier labels
+    if len(unique_labels) > 1:
+        return silhouette_score(sample, labels, metric=metric)
+    return float('-inf')
+
+
+def compute_silhouette_scores(clusterer, data: Union[pd.DataFrame, np.ndarray], sample_sizes: List[int], random_seed: int = None,
+                              report_callback: Optional[Callable[[int, float], None]] = None) -> float:
     """
     Computes the silhouette scores for the given clusterer or anomaly detector and data using subsampling.
 
@@ -44,12 +86,15 @@ def compute_silhouette_scores(clusterer, data: pd.DataFrame, sample_sizes: List[
     -----------
     clusterer : object
         Clustering or anomaly detection object that implements fit_predict or predict method.
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         Data to be clustered or classified for outliers.
     sample_sizes : List[int]
         List of sample sizes for subsampling.
     random_seed : int, optional
         Seed for random number generation.
+    report_callback : Callable[[int, float], None], optional
+        Called after each subsample with its step number and the average score so far.
+        It may raise (e.g. optuna.TrialPruned) to stop scoring the remaining subsamples.
 
     Returns:
     --------
@@ -60,45 +105,42 @@ def compute_silhouette_scores(clusterer, data: pd.DataFrame, sample_sizes: List[
     n_samples = len(data)
     silhouette_scores = []
 
-    for size in sample_sizes:
+    for step, size in enumerate(sample_sizes):
         try:
             sample_indices = rng.choice(n_samples, size=size, replace=False)
-            sample = data.iloc[sample_indices]
-
-            # Check if clusterer has fit_predict or predict
-            if hasattr(clusterer, 'fit_predict'):
-                labels = clusterer.fit_predict(sample)
-            elif hasattr(clusterer, 'predict'):
-                labels = clusterer.predict(sample)
-            else:
-                raise ValueError(
-                    f"Clusterer does not support 'fit_predict' or 'predict': {type(clusterer)}")
-
-            unique_labels = set(labels)
-            unique_labels.discard(-1)  # For HDBSCAN or outlier labels
-            if len(unique_labels) > 1:
-                score = silhouette_score(sample, labels)
-            else:
-                score = float('-inf')
-            silhouette_scores.append(score)
+            sample = data[sample_indices] if isinstance(
+                data, np.ndarray) else data.iloc[sample_indices]
+            silhouette_scores.append(score_subsample(clusterer, sample))
         except ValueError:
             silhouette_scores.append(float('-inf'))
 
+        if report_callback is not None:
+            report_callback(step, np.mean(silhouette_scores))
+
     return np.mean(silhouette_scores)
 
 
-def calculate_silhouette(clusterer, data: pd.DataFrame, random_seed: int = None) -> float:
+def calculate_silhouette(clusterer, data: Union[pd.DataFrame, np.ndarray], random_seed: int = None,
+                         report_callback: Optional[Callable[[int, float], None]] = None) -> float:
     """
     Calculates the silhouette score for a given clustering or anomaly detection model using subsampling.
 
+    The model is fitted and scored on at most three random subsamples of up to 5000 rows
+    (see define_sample_sizes), so the cost per call is bounded regardless of the data size,
+    at the price of a small sampling error in the score. Pass `random_seed` to draw the
+    same subsamples on every call.
+
     Parameters:
     -----------
     clusterer : object
         Clustering or anomaly detection model that implements fit_predict or predict method.
-    data : pd.DataFrame
+    data : pd.DataFrame or np.ndarray
         Data to be clustered or classified for outliers.
     random_seed : int, optional
         Seed for random number generation.
+    report_callback : Callable[[int, float], None], optional
+        Called after each subsample with its step number and the average score so far,
+        e.g. to report intermediate values to an Optuna trial.
 
     Returns:
     --------
@@ -106,4 +148,76 @@ def calculate_silhouette(clusterer, data: pd.DataFrame, random_seed: int = None)
         Average silhouette score across multiple subsamples.
     """
     sample_sizes = define_sample_sizes(len(data))
-    return compute_silhouette_scores(clusterer, data, sample_sizes, random_seed)
+    return compute_silhouette_scores(clusterer, data, sample_sizes, random_seed, report_callback)
+
+
+def subsample_distance_matrices(data: Union[pd.DataFrame, np.ndarray], random_seed: int = None) -> List[np.ndarray]:
+    """
+    Computes the pairwise Euclidean distance matrices of the silhouette subsamples.
+
+    The subsamples are drawn exactly as in calculate_silhouette with the same seed, so
+    scoring a clusterer with metric='precomputed' on these matrices evaluates the same rows
+    without recomputing their distances for every clusterer.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame or np.ndarray
+        Data to be clustered.
+    random_seed : int, optional
+        Seed for random number generation.
+
+    Returns:
+    --------
+    List[np.ndarray]
+        One float32 distance matrix per subsample.
+    """
+    rng = np.random.default_rng(random_seed)
+    n_samples = len(data)
+    values = np.asarray(data, dtype=np.float32)
+    distance_matrices = []
+    for size in define_sample_sizes(n_samples):
+        sample_indices = rng.choice(n_samples, size=size, replace=False)
+        sample = values[sample_indices]
+        # Fill the matrix in row blocks of about 16 MB, so that no temporaries of
+        # the size of the full matrix are allocated next to it
+        distances = np.empty((size, size), dtype=np.float32)
+        start = 0
+        for chunk in pairwise_distances_chunked(sample, metric='euclidean',
+                                                working_memory=16, n_jobs=-1):
+            distances[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        distance_matrices.append(distances)
+    return distance_matrices
+
+
+def calculate_silhouette_precomputed(clusterer, distance_matrices: List[np.ndarray],
+                                     report_callback: Optional[Callable[[int, float], None]] = None) -> float:
+    """
+    Calculates the silhouette score of a clusterer on precomputed subsample distance matrices.
+
+    Parameters:
+    -----------
+    clusterer : object
+        Clustering model created with metric='precomputed' that implements fit_predict.
+    distance_matrices : List[np.ndarray]
+        Distance matrices returned by subsample_distance_matrices.
+    report_callback : Callable[[int, float], None], optional
+        Called after each subsample with its step number and the average score so far.
+
+    Returns:
+    --------
+    float
+        Average silhouette score across the subsamples.
+    """
+    silhouette_scores = []
+    for step, distances in enumerate(distance_matrices):
+        try:
+            silhouette_scores.append(score_subsample(
+                clusterer, distances, metric='precomputed'))
+        except ValueError:
+            silhouette_scores.append(float('-inf'))
+
+        if report_callback is not None:
+            report_callback(step, np.mean(silhouette_scores))
+
+    return np.mean(silhouette_scores)
@@ -12,6 +12,44 @@ logging.basicConfig(level=logging.DEBUG,
 logger = logging.getLogger(__name__)
 
 
+def one_hot_encode(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Apply one-hot encoding to the given columns, producing the same columns as pd.get_dummies.
+
+    Each column is factorized once and its indicator matrix is filled with a single
+    indexed write, instead of one comparison pass over the column per category.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input DataFrame.
+    columns : List[str]
+        List of column names to encode.
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with the encoded columns replaced by int8 indicator columns named
+        '<column>_<category>' and appended after the remaining columns. Missing values
+        produce rows of zeros.
+    """
+    n_rows = len(df)
+    row_positions = np.arange(n_rows)
+    encoded = []
+    for col in columns:
+        categorical = pd.Categorical(df[col])
+        codes = categorical.codes
+        present = codes >= 0
+        indicators = np.zeros(
+            (n_rows, len(categorical.categories)), dtype=np.int8)
+        indicators[row_positions[present], codes[present]] = 1
+        encoded.append(pd.DataFrame(
+            indicators,
+            index=df.index,
+            columns=[f"{col}_{category}" for category in categorical.categories]))
+    return pd.concat([df.drop(columns=columns)] + encoded, axis=1)
+
+
 def preprocess_data(df: pd.DataFrame,
                     numerical_columns: List[str],
                     categorical_columns: List[str],
@@ -77,8 +115,7 @@ def preprocess_data(df: pd.DataFrame,
 
         # Apply one-hot encoding to categorical columns
         if categorical_columns:
-            df_processed = pd.get_dummies(
-                df_processed, columns=categorical_columns)
+            df_processed = one_hot_encode(df_processed, categorical_columns)
             method_description += (
                 f"One-hot encoding applied to categorical columns: {categorical_columns}.\n"
                 f"Generated columns: {list(set(df_processed.columns) - initial_columns)}.\n"
@@ -96,20 +133,32 @@ def preprocess_data(df: pd.DataFrame,
         new_categorical_columns = list(
             set(df_processed.columns) - initial_columns)
 
-        # Process numerical columns
-        skewed_features = []
-        normal_features = []
-
-        for col in numerical_columns:
-            # Calculate skewness of the column
-            skewness = skew(df_processed[col].dropna())
+        # Process numerical columns as one contiguous float block, addressed by
+        # column position rather than looked up by name for every step
+        numerical_block = np.ascontiguousarray(
+            df_processed[numerical_columns].to_numpy(dtype=np.float64))
+
+        # Calculate skewness of every numerical column at once, ignoring missing values
+        skewness_values = np.ma.filled(
+            skew(numerical_block, axis=0, nan_policy='omit'), np.nan) \
+            if numerical_columns else np.empty(0)
+        skewed_mask = np.abs(skewness_values) > skew_threshold
+        skewed_idx = np.flatnonzero(skewed_mask)
+        normal_idx = np.flatnonzero(~skewed_mask)
+
+        # Apply log transformation to the positive values of highly skewed columns
+        if skewed_idx.size:
+            skewed_block = numerical_block[:, skewed_idx]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                numerical_block[:, skewed_idx] = np.where(
+                    skewed_block > 0, np.log1p(skewed_block), skewed_block)
+
+        skewed_features = [numerical_columns[i] for i in skewed_idx]
+        normal_features = [numerical_columns[i] for i in normal_idx]
+
+        for col, skewness, is_skewed in zip(numerical_columns, skewness_values, skewed_mask):
             logger.info(f"Skewness for {col}: {skewness}")
-
-            if abs(skewness) > skew_threshold:
-                # Apply log transformation to highly skewed data
-                df_processed[col] = df_processed[col].apply(
-                    lambda x: np.log1p(x) if x > 0 else x)
-                skewed_features.append(col)
+            if is_skewed:
                 method_description += (
                     f"Log transformation applied to skewed column: {col}.\n"
                     f"Skewness: {skewness}.\n"
@@ -118,7 +167,6 @@ def preprocess_data(df: pd.DataFrame,
                 )
             else:
                 # Standardize normally distributed data
-                normal_features.append(col)
                 method_description += (
                     f"Column considered normally distributed: {col}.\n"
                     f"Skewness: {skewness}.\n"
@@ -128,8 +176,8 @@ def preprocess_data(df: pd.DataFrame,
         # Apply Min-Max scaling for log-transformed (skewed) columns
         if skewed_features:
             scaler = MinMaxScaler()
-            df_processed[skewed_features] = scaler.fit_transform(
-                df_processed[skewed_features])
+            numerical_block[:, skewed_idx] = scaler.fit_transform(
+                numerical_block[:, skewed_idx])
             method_description += (
                 f"Min-Max scaling applied to skewed features: {skewed_features}.\n"
                 f"Scaler used: MinMaxScaler.\n"
@@ -141,8 +189,8 @@ def preprocess_data(df: pd.DataFrame,
         # Apply Standard scaling for normal-distributed columns
         if normal_features:
             scaler = StandardScaler()
-            df_processed[normal_features] = scaler.fit_transform(
-                df_processed[normal_features])
+            numerical_block[:, normal_idx] = scaler.fit_transform(
+                numerical_block[:, normal_idx])
             method_description += (
                 f"Standard scaling applied to normal features: {normal_features}.\n"
                 f"Scaler used: StandardScaler.\n"
@@ -152,10 +200,9 @@ def preprocess_data(df: pd.DataFrame,
                 f"Standard scaling applied to normally distributed features: {normal_features}")
 
         # Combine numerical and new categorical columns for the final list of features
-        available_features = numerical_columns + new_categorical_columns
-
-        # Filter the DataFrame to include only the available features
-        df_processed = df_processed[available_features]
+        df_processed = pd.concat(
+            [pd.DataFrame(numerical_block, index=df_processed.index, columns=numerical_columns),
+             df_processed[new_categorical_columns]], axis=1)
 
         # Log the method description for reference
         logger.info(f"Preprocessing method description:\n{method_description}")
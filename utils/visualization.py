@@ -1,13 +1,15 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import umap
 import logging
 import pandas as pd
-import matplotlib.pyplot as plt
-import umap
-from optuna.importance import get_param_importances
+import matplotlib
 from typing import Optional, List
 
+# Charts are drawn from worker threads straight to PNG files, so use the
+# non-interactive Agg backend and let it split long paths (UMAP scatter plots)
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+plt.rcParams["agg.path.chunksize"] = 10000
+
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -265,7 +267,9 @@ def create_umap_projection(
     if feature_data.empty:
         raise ValueError("No features available for UMAP projection")
 
-    # Perform UMAP reduction
+    # Perform UMAP reduction; umap pulls in numba, so it is only imported
+    # when a projection is actually requested
+    import umap
     reducer = umap.UMAP(n_components=2)
     embedding = reducer.fit_transform(feature_data)
 
@@ -353,6 +357,8 @@ def plot_param_importances(study, output_dir):
     None
         The parameter importance plot is saved to the specified output directory.
     """
+    from optuna.importance import get_param_importances
+
     importances = get_param_importances(study)
     params = list(importances.keys())
     values = list(importances.values())